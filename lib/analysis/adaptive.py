@@ -0,0 +1,198 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import math
+from bisect import bisect_left
+
+# File extension of the table with the difficulty of each question, stored
+# next to the quiz file
+DIFFICULTIES_EXTENSION = ".irt"
+
+# Bound on the difficulty (in logits) of questions always or never answered
+_MAX_LOGIT = 6.
+
+
+def difficulties_from_stats(item_stats):
+    """
+    Convert the p-values of an item analysis report into Rasch difficulties
+    """
+    difficulties = []
+    for stats in item_stats:
+        p_value = min(max(stats.difficulty, 1e-6), 1 - 1e-6)
+        difficulties.append(
+            min(max(math.log((1 - p_value) / p_value), -_MAX_LOGIT),
+                _MAX_LOGIT),
+        )
+    return difficulties
+
+
+def save_difficulties(quiz_filename, difficulties):
+    """
+    Store the difficulty table of a quiz next to the quiz file
+    """
+    with open(
+        quiz_filename + DIFFICULTIES_EXTENSION, "w", encoding="utf8",
+    ) as table:
+        for difficulty in difficulties:
+            table.write(f"{difficulty}\n")
+
+
+def load_difficulties(quiz_filename, num_of_questions):
+    """
+    Load the difficulty table of a quiz, if any. Without it every question is
+    considered of average difficulty
+    """
+    try:
+        with open(
+            quiz_filename + DIFFICULTIES_EXTENSION, "r", encoding="utf8",
+        ) as table:
+            difficulties = [float(line) for line in table if line.strip()]
+    except FileNotFoundError:
+        return [0.] * num_of_questions
+
+    if len(difficulties) != num_of_questions:
+        raise ValueError("Difficulty table does not match the quiz")
+    return difficulties
+
+
+def _find(parent, idx):
+    """
+    Follow the skip pointers up to the first free slot, compressing the path
+    """
+    root = idx
+    while parent[root] != root:
+        root = parent[root]
+    while parent[idx] != root:
+        parent[idx], idx = root, parent[idx]
+    return root
+
+
+class DifficultyIndex:
+    """
+    Questions sorted by difficulty, supporting the removal of the question
+    closest to a given difficulty in O(log n)
+    """
+    def __init__(self, difficulties):
+        order = sorted(range(len(difficulties)), key=difficulties.__getitem__)
+        self._qidxs = order
+        self._difficulties = [difficulties[qidx] for qidx in order]
+        self._size = len(order)
+
+        # Skip pointers over the taken positions: _left[p + 1] leads to the
+        # closest free position before or at p (slot 0 means none), while
+        # _right[p] leads to the closest free position at or after p (slot
+        # size means none)
+        self._left = list(range(self._size + 1))
+        self._right = list(range(self._size + 1))
+
+    def __len__(self):
+        return self._size
+
+    def pop_closest(self, difficulty):
+        """
+        Remove and return the index of the question whose difficulty is the
+        closest to the given one
+        """
+        if self._size == 0:
+            raise IndexError("No question left")
+
+        pos = bisect_left(self._difficulties, difficulty)
+        lower = _find(self._left, pos) - 1
+        upper = _find(self._right, pos)
+        if upper == len(self._difficulties) or (
+            lower >= 0 and
+            difficulty - self._difficulties[lower] <=
+            self._difficulties[upper] - difficulty
+        ):
+            pos = lower
+        else:
+            pos = upper
+
+        self._left[pos + 1] = pos
+        self._right[pos] = pos + 1
+        self._size -= 1
+        return self._qidxs[pos]
+
+
+class AdaptiveSession:
+    """
+    Adaptive testing based on the Rasch model: every question is chosen to be
+    the most informative one given the current ability estimate
+    """
+    def __init__(self, difficulties, max_questions=None, target_error=0.3):
+        self._difficulties = difficulties
+        self._index = DifficultyIndex(difficulties)
+        self._max_questions = max_questions or len(difficulties)
+        self._target_error = target_error
+
+        self._answered = []
+        self._ability = 0.
+        self._information = 0.
+
+    @property
+    def ability(self):
+        """
+        Current ability estimate, in logits
+        """
+        return self._ability
+
+    @property
+    def standard_error(self):
+        """
+        Standard error of the current ability estimate
+        """
+        return 1 / math.sqrt(self._information + 1)
+
+    @property
+    def finished(self):
+        """
+        Whether the estimate is reliable enough or no question is left
+        """
+        return (
+            len(self._index) == 0 or
+            len(self._answered) >= self._max_questions or
+            self.standard_error <= self._target_error
+        )
+
+    def next_question(self):
+        """
+        Pick the index of the most informative question still to be asked,
+        i.e. the one whose difficulty is the closest to the ability
+        """
+        return self._index.pop_closest(self._ability)
+
+    def record(self, qidx, correct):
+        """
+        Update the ability estimate with the outcome of a question
+        """
+        self._answered.append((self._difficulties[qidx], 1 if correct else 0))
+
+        # Maximum a posteriori estimate with a standard normal prior, which
+        # stays finite even when all the answers are right (or wrong)
+        ability = self._ability
+        for _ in range(20):
+            gradient, information = -ability, 0.
+            for difficulty, score in self._answered:
+                prob = 1 / (1 + math.exp(difficulty - ability))
+                gradient += score - prob
+                information += prob * (1 - prob)
+            step = gradient / (information + 1)
+            ability += step
+            if abs(step) < 1e-6:
+                break
+        self._ability = ability
+        self._information = information
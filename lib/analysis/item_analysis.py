@@ -0,0 +1,213 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from lib.datatypes.quiz import MAX_ANSWERS, answers_to_mask
+from lib.enums.header_text import HeaderText
+
+_OPTION_BITS = np.arange(MAX_ANSWERS, dtype=np.uint8)
+
+
+def encode_submissions(quiz, submissions):
+    """
+    Encode a batch of submissions as a submissions x questions mask matrix
+    """
+    questions = quiz.questions
+    masks = np.zeros((len(submissions), len(questions)), dtype=np.uint8)
+    for sidx, user_answers in enumerate(submissions):
+        masks[sidx] = [
+            answers_to_mask(question.number_of_answers, answers)
+            for question, answers in zip(questions, user_answers)
+        ]
+    return masks
+
+
+@dataclass
+class ItemStats:
+    """
+    Statistics of a single question over all the analysed submissions
+    """
+    index: int
+    label: str
+    difficulty: float
+    discrimination: float
+    option_rates: list
+
+    def log(self):
+        print(f"[QUESTION {self.index + 1}] ({self.label})")
+        print(f"  difficulty: {self.difficulty:.3f}")
+        print(f"  discrimination: {self.discrimination:.3f}")
+        if self.option_rates is not None:
+            for aidx, rate in enumerate(self.option_rates):
+                print(f"  {aidx}) {rate:.2%}")
+
+
+class ItemAnalysis:
+    """
+    Item analysis (difficulty, point-biserial discrimination and option
+    selection rates) accumulated over chunks of graded submissions
+    """
+    def __init__(self, quiz, chunk_size=10000):
+        self._quiz = quiz
+        self._chunk_size = chunk_size
+
+        num_of_questions = len(quiz.questions)
+        self._key = np.zeros(num_of_questions, dtype=np.uint8)
+        self._num_of_answers = np.zeros(num_of_questions, dtype=np.intp)
+        for qidx, question in enumerate(quiz.questions):
+            self._key[qidx] = answers_to_mask(
+                question.number_of_answers, question.correct_answers,
+            )
+            self._num_of_answers[qidx] = question.number_of_answers
+
+        # Running sums needed by the point-biserial correlation, where x is
+        # the score of a question and t the total score of a submission
+        self._num_of_scored = 0
+        self._sum_x = np.zeros(num_of_questions)
+        self._sum_xt = np.zeros(num_of_questions)
+        self._sum_t = 0.
+        self._sum_tt = 0.
+
+        self._num_of_selected = 0
+        self._option_counts = np.zeros(
+            (num_of_questions, MAX_ANSWERS), dtype=np.int64,
+        )
+
+    def add_submissions(self, submissions):
+        """
+        Analyse an iterable of submissions, each one with the answers given
+        to every question as passed to Quiz.compute_results
+        """
+        chunk = []
+        for user_answers in submissions:
+            chunk.append(user_answers)
+            if len(chunk) == self._chunk_size:
+                self._add_masks_chunk(encode_submissions(self._quiz, chunk))
+                chunk = []
+        if chunk:
+            self._add_masks_chunk(encode_submissions(self._quiz, chunk))
+
+    def add_masks(self, masks):
+        """
+        Analyse a submissions x questions matrix of answer masks, as built by
+        encode_submissions. It can be a memory map larger than the RAM, since
+        it is read one chunk at a time
+        """
+        for start in range(0, masks.shape[0], self._chunk_size):
+            self._add_masks_chunk(
+                np.asarray(masks[start:start + self._chunk_size]),
+            )
+
+    def add_selections(self, selections):
+        """
+        Analyse a submissions x questions x options boolean tensor, read one
+        chunk at a time
+        """
+        weights = (1 << _OPTION_BITS).astype(np.uint8)
+        for start in range(0, selections.shape[0], self._chunk_size):
+            chunk = np.asarray(
+                selections[start:start + self._chunk_size, :, :MAX_ANSWERS],
+                dtype=np.uint8,
+            )
+            masks = (chunk * weights[:chunk.shape[2]]).sum(
+                axis=2, dtype=np.uint8,
+            )
+            self._add_masks_chunk(masks)
+
+    def add_results(self, results):
+        """
+        Analyse an iterable of outputs of Quiz.compute_results, or of their
+        HeaderText.RESULTS vectors. They carry no option selection, so they
+        only contribute to difficulty and discrimination
+        """
+        chunk = []
+        for result in results:
+            if isinstance(result, dict):
+                result = result[HeaderText.RESULTS]
+            chunk.append(result)
+            if len(chunk) == self._chunk_size:
+                self._add_scores(np.asarray(chunk) > 0)
+                chunk = []
+        if chunk:
+            self._add_scores(np.asarray(chunk) > 0)
+
+    def _add_masks_chunk(self, masks):
+        """
+        Accumulate the statistics of a chunk of answer masks
+        """
+        self._add_scores(masks == self._key)
+
+        selections = (masks[:, :, np.newaxis] >> _OPTION_BITS) & 1
+        self._option_counts += selections.sum(axis=0, dtype=np.int64)
+        self._num_of_selected += masks.shape[0]
+
+    def _add_scores(self, scores):
+        """
+        Accumulate a submissions x questions matrix of totally correct flags
+        """
+        x = scores.astype(np.float64)
+        t = x.sum(axis=1)
+        self._num_of_scored += x.shape[0]
+        self._sum_x += x.sum(axis=0)
+        self._sum_xt += t @ x
+        self._sum_t += t.sum()
+        self._sum_tt += t @ t
+
+    def report(self):
+        """
+        Statistics of every question of the quiz
+        """
+        n = self._num_of_scored
+        if n == 0:
+            raise ValueError("No submission has been analysed")
+
+        # Discrimination correlates each question with the rest score, i.e.
+        # the total score without the question itself, so that the question
+        # does not correlate with itself
+        sum_x = self._sum_x
+        sum_r = self._sum_t - sum_x
+        sum_rr = self._sum_tt - 2 * self._sum_xt + sum_x
+        sum_xr = self._sum_xt - sum_x
+        cov = n * sum_xr - sum_x * sum_r
+        var_x = n * sum_x - sum_x * sum_x
+        var_r = n * sum_rr - sum_r * sum_r
+        with np.errstate(divide="ignore", invalid="ignore"):
+            discrimination = np.where(
+                (var_x > 0) & (var_r > 0),
+                cov / np.sqrt(var_x * var_r),
+                np.nan,
+            )
+        difficulty = sum_x / n
+
+        option_rates = None
+        if self._num_of_selected:
+            option_rates = self._option_counts / self._num_of_selected
+
+        return [
+            ItemStats(
+                index=qidx,
+                label=question.label,
+                difficulty=float(difficulty[qidx]),
+                discrimination=float(discrimination[qidx]),
+                option_rates=None if option_rates is None else
+                option_rates[qidx, :self._num_of_answers[qidx]].tolist(),
+            )
+            for qidx, question in enumerate(self._quiz.questions)
+        ]
@@ -0,0 +1,132 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+from tkinter import messagebox
+
+from lib.analysis.adaptive import AdaptiveSession
+from lib.components.navigable_frame import NavigableFrame
+
+
+class AdaptiveQuizUI(NavigableFrame):
+    """
+    UI for the adaptive quiz flow, where the next question depends on the
+    answers given so far
+    """
+    def __init__(self, parent, quiz, difficulties, max_questions=None):
+        # There is no going back, since the next question depends on the
+        # answer just given
+        super().__init__(parent, with_prev=False)
+
+        self._parent = parent
+        self._quiz = None
+        self._session = None
+        self._asked = []
+        self._user_answers = []
+        self._curr_qidx = None
+
+        self._add_button("Submit!", self._handle_submit)
+
+        self.reset(quiz, difficulties, max_questions)
+
+    def reset(self, quiz, difficulties, max_questions=None):
+        """
+        Start a new adaptive session on another quiz
+        """
+        self._quiz = quiz
+        self._session = AdaptiveSession(difficulties, max_questions)
+        self._asked = []
+        self._user_answers = []
+
+        self._curr_qidx = self._session.next_question()
+        self._show_question(self._quiz.questions[self._curr_qidx])
+        self._update_navigation()
+
+    def release(self):
+        """
+        Drop the quiz and the session of the last run
+        """
+        self._quiz = None
+        self._session = None
+        self._asked = []
+        self._user_answers = []
+
+    def _update_navigation(self):
+        """
+        Show the progress and the current ability estimate, the quiz can
+        always go on until it is over
+        """
+        self._idx_label.configure(
+            text=f"Question {len(self._asked) + 1} - ability "
+                 f"{self._session.ability:+.2f} "
+                 f"(±{self._session.standard_error:.2f})",
+        )
+
+    def _record_answer(self):
+        """
+        Grade the question on screen and update the ability estimate
+        """
+        answers = [
+            idx for idx, choice in enumerate(self._question_frame.choices)
+            if choice.get()
+        ]
+        question = self._quiz.questions[self._curr_qidx]
+        self._asked.append(self._curr_qidx)
+        self._user_answers.append(answers)
+        self._session.record(
+            self._curr_qidx, question.correct_answers == answers,
+        )
+
+    def _next_handler(self):
+        """
+        Record the answer and move to the most informative question left
+        """
+        self._record_answer()
+        if self._session.finished:
+            messagebox.showinfo(
+                title="Quiz completed",
+                message="Your ability has been estimated reliably, "
+                        "the quiz is over!",
+            )
+            self._terminate()
+            return
+
+        self._curr_qidx = self._session.next_question()
+        self._show_question(self._quiz.questions[self._curr_qidx])
+        self._update_navigation()
+
+    def _handle_submit(self):
+        """
+        Submit the answers given so far and check the results
+        """
+        msg = "Are you sure you want to submit your answers and terminate " \
+              "the quiz?"
+        submit_ok = messagebox.askyesno(title="Submit results", message=msg)
+        if not submit_ok:
+            return
+        self._record_answer()
+        self._terminate()
+
+    def _terminate(self):
+        """
+        Hand the questions asked and their answers to the controller
+        """
+        print("Answers submitted")
+        self._parent.terminate_quiz(
+            self._user_answers,
+            self._quiz.subset(self._asked),
+            self._session.ability,
+        )
@@ -16,22 +16,32 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 
 import tkinter as tk
+import tkinter.filedialog as fd
 from PIL import ImageTk, Image
 from tkinter import messagebox
 
+from lib.components.adaptive_quiz_ui import AdaptiveQuizUI
 from lib.components.results_frame import ResultsFrame
 from lib.components.start_frame import StartFrame
 from lib.components.quiz_ui import QuizUI
+from lib.components.review_ui import ReviewUI
+from lib.converters.html_exporter import export_html
+from lib.datatypes.loader import load_quiz
+from lib.enums.header_text import HeaderText
 
 
 class MainWindow(tk.Tk):
     """
     Main window of the application
     """
-    def __init__(self, width, height):
+    def __init__(self, width, height, quiz_loader=load_quiz):
         super().__init__()
 
         self._quiz = None
+        self._summary = None
+        self._ability = None
+        self._user_answers = None
+        self._quiz_loader = quiz_loader
         self._icon_img = ImageTk.PhotoImage(
             Image.open("res/imgs/icon.png").resize((100, 100)),
         )
@@ -48,31 +58,94 @@ class MainWindow(tk.Tk):
         self._bg.place(x=0, y=0, relwidth=1, relheight=1)
 
         self._end = tk.BooleanVar()
-        self._start_frm = StartFrame(self, self._icon_img)
-        self._results_frm = None
+        self._start_frm = StartFrame(self, self._icon_img, self._quiz_loader)
+
+        # Screens are built the first time they are needed and then reset for
+        # every session, so that restarting does not depend on the size of
+        # the previous one
+        self._screens = {}
+        self._screen = None
 
         # Custom logic when pressing "X" button to close the program
         # self.protocol('WM_DELETE_WINDOW', self._ask_exit_program)
 
         self._end.set(False)
         self._end.trace_add('write', self._handle_terminate)
-        self._start_frm.pack(side=tk.BOTTOM, expand=True)
+        self._switch_to(self._start_frm)
 
     def restart(self):
         """
         Restart the quiz from scratch
         """
-        assert self._results_frm is not None
-        self._results_frm.destroy()
-        self._start_frm.destroy()
         self._end.set(False)
         self._quiz = None
-        self._start_frm = StartFrame(self, self._icon_img)
-        self._start_frm.pack(side=tk.BOTTOM, expand=True)
+        self._summary = None
+        self._ability = None
+        self._user_answers = None
+        for screen in self._screens.values():
+            screen.release()
+        self._switch_to(self._start_frm)
+
+    def show_correction(self, only_mistakes=False):
+        """
+        Review the submitted answers, optionally only the wrong or partially
+        correct ones
+        """
+        self._show_screen(
+            ReviewUI,
+            self._quiz,
+            self._summary,
+            self._user_answers,
+            only_mistakes,
+        )
 
-    def show_correction(self):
-        self._results_frm = QuizUI(self, self._quiz, True, self._user_answers)
-        self._results_frm.pack(side=tk.BOTTOM, expand=True)
+    def export_correction(self):
+        """
+        Save the correction of the submitted answers as a printable page
+        """
+        filename = fd.asksaveasfilename(
+            defaultextension=".html",
+            filetypes=(("HTML pages", "*.html"), ("All files", "*.*")),
+        )
+        if not filename:
+            return
+        try:
+            export_html(
+                self._quiz.questions,
+                filename,
+                self._user_answers,
+                title="Correction",
+                summary=self._summary,
+            )
+        except OSError as exc:
+            messagebox.showerror(
+                title="File error",
+                message="Cannot write the correction!",
+            )
+            print(exc)
+            return
+        print(f"Correction exported to {filename}")
+
+    def _show_screen(self, screen_cls, *args):
+        """
+        Show the screen of the given class, building it the first time and
+        resetting it with the data of the current session afterwards
+        """
+        screen = self._screens.get(screen_cls)
+        if screen is None:
+            screen = self._screens[screen_cls] = screen_cls(self, *args)
+        else:
+            screen.reset(*args)
+        self._switch_to(screen)
+
+    def _switch_to(self, screen):
+        """
+        Replace the screen on the window
+        """
+        if self._screen is not None:
+            self._screen.hide()
+        self._screen = screen
+        self._screen.show()
 
     def _ask_exit_program(self):
         """
@@ -93,37 +166,36 @@ class MainWindow(tk.Tk):
             raise ValueError("Quiz cannot be undefined at this point")
         if not self._end.get():
             return
-        summary = self._quiz.compute_results(self._user_answers)
-        self._release_children(self)
-        self._results_frm = ResultsFrame(self, self._quiz, summary)
-        self._results_frm.pack(side=tk.BOTTOM, expand=True, pady=20)
-
-    def _release_children(self, item):
-        """
-        Release all allocated items
-        """
-        for child in item.winfo_children():
-            self._release_children(child)
-        if item not in (self, self._bg):
-            item.destroy()
+        self._summary = self._quiz.compute_results(self._user_answers)
+        if self._ability is not None:
+            self._summary[HeaderText.ABILITY] = self._ability
+        self._show_screen(ResultsFrame, self._quiz, self._summary)
 
-    def terminate_quiz(self, user_answers):
+    def terminate_quiz(self, user_answers, quiz=None, ability=None):
         """
-        Terminate the quiz and trigger the observer
+        Terminate the quiz and trigger the observer. Adaptive sessions also
+        provide the quiz made of the questions actually asked and the
+        estimated ability
         """
+        if quiz is not None:
+            self._quiz = quiz
+        self._ability = ability
         self._user_answers = user_answers
         self._end.set(True)
 
-    def set_quiz(self, value):
+    def set_quiz(self, value, difficulties=None):
         """
-        Receive quiz data structure
+        Receive quiz data structure, along with the difficulty of each
+        question when the session is adaptive
         """
         if value is None:
             raise ValueError("Quiz data structure cannot be none")
         self._quiz = value
-        self._start_frm.pack_forget()
         print("Quiz is ready")
-        QuizUI(self, self._quiz).pack(side=tk.BOTTOM, expand=True)
+        if difficulties is None:
+            self._show_screen(QuizUI, self._quiz)
+        else:
+            self._show_screen(AdaptiveQuizUI, self._quiz, difficulties)
 
     def start(self):
         """
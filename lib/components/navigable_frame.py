@@ -0,0 +1,132 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import tkinter as tk
+
+from lib.components.quittable_frame import QuittableFrame
+from lib.components.question_frame import QuestionFrame
+
+
+class NavigableFrame(QuittableFrame):
+    """
+    Screen showing one question at a time in a reused frame, with the
+    position and the navigation buttons at the bottom
+    """
+    def __init__(self, parent, with_prev=True):
+        super().__init__(parent)
+
+        self._curr_idx = 0
+        self._num_of_questions = 0
+        self._question_frame = None
+
+        self._lower_third = tk.Frame(self._parent, bg='linen')
+        self._lower_third_lower = tk.Frame(self._lower_third, bg='linen')
+        self._idx_label = tk.Label(
+            self._lower_third,
+            font=("Helvetica", 16),
+            bg='linen',
+        )
+        self._idx_label.pack(pady=5)
+        self._prev_btn = None
+        if with_prev:
+            self._prev_btn = self._add_button(
+                "<< Prev", self._prev_handler, tk.LEFT,
+            )
+        self._next_btn = self._add_button(
+            "Next >>", self._next_handler, tk.RIGHT,
+        )
+        self._lower_third_lower.pack()
+
+    def _add_button(self, text, command, side=None):
+        """
+        Add a button to the bottom bar, between Prev and Next if no side is
+        given
+        """
+        button = tk.Button(
+            self._lower_third_lower,
+            text=text,
+            font=("Helvetica", 16),
+            cursor="hand1",
+            bg="black",
+            fg="orange",
+            activebackground="orange",
+            activeforeground="black",
+            command=command,
+        )
+        button.pack(side=side, padx=20, pady=5)
+        return button
+
+    def _show_question(self, question, show_results=False, user_answers=[]):
+        """
+        Show a question, building the frame the first time
+        """
+        if self._question_frame is None:
+            self._question_frame = QuestionFrame(
+                self, question, show_results, user_answers,
+            )
+            self._question_frame.pack()
+        else:
+            self._question_frame.show_question(
+                question, show_results, user_answers,
+            )
+
+    def _position_text(self):
+        """
+        Text of the position label
+        """
+        return f"{self._curr_idx + 1}/{self._num_of_questions}"
+
+    def _update_navigation(self):
+        """
+        Update the position label and the state of the navigation buttons
+        """
+        self._idx_label.configure(text=self._position_text())
+
+        prev_state, next_state = tk.NORMAL, tk.NORMAL
+        prev_cursor, next_cursor = "hand1", "hand1"
+        if self._curr_idx == 0:
+            prev_state = tk.DISABLED
+            prev_cursor = ""
+        if self._curr_idx == self._num_of_questions - 1:
+            next_state = tk.DISABLED
+            next_cursor = ""
+
+        if self._prev_btn is not None:
+            self._prev_btn.config(state=prev_state, cursor=prev_cursor)
+        self._next_btn.config(state=next_state, cursor=next_cursor)
+
+    def _btn_handler(self, inc):
+        """
+        Show the question at the new index
+        """
+        raise NotImplementedError
+
+    def _prev_handler(self):
+        """
+        Go to the previous question
+        """
+        if self._curr_idx == 0:
+            return
+        self._btn_handler(-1)
+
+    def _next_handler(self):
+        """
+        Go to the next question
+        """
+        if self._curr_idx == self._num_of_questions - 1:
+            return
+        self._btn_handler(1)
@@ -27,10 +27,10 @@ class QuestionFrame(tk.Frame):
 
         self._choices = []
         self._checkboxes = []
+        self._num_of_answers = 0
 
-        tk.Label(
+        self._text_label = tk.Label(
             master=self,
-            text=question.text,
             wraplength=600,
             justify=tk.LEFT,
             font=("Arial", 12, "bold"),
@@ -39,10 +39,40 @@ class QuestionFrame(tk.Frame):
             padx=10,
             pady=5,
             bg="LemonChiffon2"
-        ).pack(fill=tk.X, expand=True, padx=20, pady=10)
+        )
+        self._text_label.pack(fill=tk.X, expand=True, padx=20, pady=10)
 
-        for idx, ans in enumerate(question.answers):
+        self.show_question(question, show_results, user_answers)
+
+    def show_question(self, question, show_results=False, user_answers=[]):
+        """
+        Display another question reusing the widgets already allocated
+        """
+        self._text_label.configure(text=question.text)
+
+        while len(self._checkboxes) < len(question.answers):
             self._choices.append(tk.BooleanVar())
+            self._checkboxes.append(
+                tk.Checkbutton(
+                    master=self,
+                    variable=self._choices[-1],
+                    wraplength=600,
+                    font=("Courier", 10),
+                    onvalue=True,
+                    offvalue=False,
+                    height=2,
+                    padx=10,
+                    cursor="hand1",
+                    bg='linen',
+                    highlightthickness=0, bd=0,
+                    justify=tk.LEFT,
+                    compound=tk.LEFT,
+                ),
+            )
+        for chkb in self._checkboxes[len(question.answers):]:
+            chkb.pack_forget()
+
+        for idx, ans in enumerate(question.answers):
             text_color = "black"
             check_state = tk.NORMAL
             if show_results:
@@ -52,32 +82,21 @@ class QuestionFrame(tk.Frame):
                 elif idx in question.correct_answers or idx in user_answers:
                     text_color = "red"
 
-            chkb = tk.Checkbutton(
-                master=self,
+            chkb = self._checkboxes[idx]
+            chkb.configure(
                 text=f" {ans}",
-                variable=self._choices[idx],
-                wraplength=600,
-                font=("Courier", 10),
-                onvalue=True,
-                offvalue=False,
-                height=2,
-                padx=10,
-                cursor="hand1",
-                bg='linen',
-                highlightthickness=0, bd=0,
-                justify=tk.LEFT,
-                compound=tk.LEFT,
                 state=check_state,
                 disabledforeground=text_color,
             )
-            chkb.pack(anchor="w", pady=3)
+            self._choices[idx].set(idx in user_answers)
+            if idx >= self._num_of_answers:
+                chkb.pack(anchor="w", pady=3)
 
-            if show_results and idx in user_answers:
-                chkb.select()
+        self._num_of_answers = len(question.answers)
 
     @property
     def choices(self):
         """
         The choices property
         """
-        return self._choices
+        return self._choices[:self._num_of_answers]
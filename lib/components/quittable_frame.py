@@ -21,20 +21,42 @@ from tkinter import messagebox
 
 class QuittableFrame(tk.Frame):
     """
-    Abstraction that provides a method to exit or restart the session
+    Abstraction that provides a method to exit or restart the session.
+    Screens are built once and reused: the controller shows and hides them,
+    and resets them with the data of each new session
     """
     def __init__(self, parent):
         super().__init__()
         self._parent = parent
+        self._lower_third = None
+
+    def show(self):
+        """
+        Put the screen, and its controls if any, on the window
+        """
+        if self._lower_third is not None:
+            self._lower_third.pack(side=tk.BOTTOM, pady=20)
+        self.pack(side=tk.BOTTOM, expand=True)
+
+    def hide(self):
+        """
+        Take the screen off the window, keeping its widgets alive
+        """
+        if self._lower_third is not None:
+            self._lower_third.pack_forget()
+        self.pack_forget()
+
+    def release(self):
+        """
+        Drop the references to the data of the last session
+        """
 
     def handle_quit(self):
         """
         Give the user the possibility to start a new quiz session or exit the
         program
         """
-        for c in self.winfo_children():
-            c.destroy()
-        self.destroy()
+        self.hide()
         should_quit = messagebox.askyesno(
             title="Restart or exit",
             message="Do you want to exit the program?\n"
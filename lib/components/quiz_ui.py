@@ -15,109 +15,47 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see <https://www.gnu.org/licenses/>.
 
-import tkinter as tk
 from tkinter import messagebox
 
-from lib.components.quittable_frame import QuittableFrame
-from lib.components.question_frame import QuestionFrame
+from lib.components.navigable_frame import NavigableFrame
 
 
-class QuizUI(QuittableFrame):
+class QuizUI(NavigableFrame):
     """
     UI for the quiz flow
     """
-    def __init__(self, parent, quiz, show_results=False, user_answers=[]):
+    def __init__(self, parent, quiz):
         super().__init__(parent)
 
         self._parent = parent
-        self._quiz = quiz
-        self._curr_idx = 0
-        self._user_answers = user_answers
+        self._quiz = None
 
-        self._questions_frames = []
-        for qidx, question in enumerate(self._quiz.questions):
-            self._questions_frames.append(
-                QuestionFrame(
-                    self,
-                    question,
-                    show_results,
-                    self._user_answers[qidx] if show_results else [],
-                ),
-            )
-        self._num_of_questions = len(self._questions_frames)
-        self._questions_frames[self._curr_idx].pack()
+        # A single frame is reconfigured for every question, and only the
+        # answers actually given are stored, so the memory used does not
+        # depend on the number of questions
+        self._answers = {}
 
-        self._lower_third = tk.Frame(self._parent, bg='linen')
-        self._lower_third_lower = tk.Frame(self._lower_third, bg='linen')
-        self._idx_label = tk.Label(
-            self._lower_third,
-            text=f"{self._curr_idx + 1}/{self._num_of_questions}",
-            font=("Helvetica", 16),
-            bg='linen',
-        )
-        self._idx_label.pack(pady=5)
-        self._prev_btn = tk.Button(
-            self._lower_third_lower,
-            text="<< Prev",
-            font=("Helvetica", 16),
-            cursor="hand1",
-            bg="black",
-            fg="orange",
-            activebackground="orange",
-            activeforeground="black",
-            command=self._prev_handler,
-            state=tk.DISABLED,
-        )
-        self._prev_btn.pack(side=tk.LEFT, padx=20, pady=5)
-        self._next_btn = tk.Button(
-            self._lower_third_lower,
-            text="Next >>",
-            font=("Helvetica", 16),
-            cursor="hand1",
-            bg="black",
-            fg="orange",
-            activebackground="orange",
-            activeforeground="black",
-            command=self._next_handler,
-        )
-        self._next_btn.pack(side=tk.RIGHT, padx=20, pady=5)
+        self._submit_btn = self._add_button("Submit!", self._handle_submit)
 
-        if not show_results:
-            self._submit_btn = tk.Button(
-                self._lower_third_lower,
-                text="Submit!",
-                font=("Helvetica", 16),
-                cursor="hand1",
-                bg="black",
-                fg="orange",
-                activebackground="orange",
-                activeforeground="black",
-                command=self._handle_submit,
-            )
-        else:
-            self._submit_btn = tk.Button(
-                self._lower_third_lower,
-                text="Quit",
-                font=("Helvetica", 16),
-                cursor="hand1",
-                bg="black",
-                fg="orange",
-                activebackground="orange",
-                activeforeground="black",
-                command=self._handle_quit,
-            )
+        self.reset(quiz)
 
-        self._submit_btn.pack(padx=20, pady=5)
-        self._lower_third_lower.pack()
-        self._lower_third.pack(side=tk.BOTTOM, pady=20)
+    def reset(self, quiz):
+        """
+        Start a new session on another quiz, from its first question
+        """
+        self._quiz = quiz
+        self._curr_idx = 0
+        self._answers = {}
+        self._num_of_questions = len(self._quiz.questions)
+        self._show_question(self._quiz.questions[self._curr_idx])
+        self._update_navigation()
 
-    def _handle_quit(self):
+    def release(self):
         """
-        Give the user the possibility to start a new session or exit the
-        program
+        Drop the quiz and the answers of the last session
         """
-        self._lower_third.destroy()
-        super().handle_quit()
+        self._quiz = None
+        self._answers = {}
 
     def _handle_submit(self):
         """
@@ -129,51 +67,36 @@ class QuizUI(QuittableFrame):
         if not submit_ok:
             return
         print("Answers submitted")
-        self._lower_third.destroy()
-        self.destroy()
+        self._save_answers()
         self._parent.terminate_quiz(
             [
-                [idx for idx, choice in enumerate(qsf.choices) if choice.get()]
-                for qsf in self._questions_frames
+                self._answers.get(qidx, [])
+                for qidx in range(self._num_of_questions)
             ]
         )
 
+    def _save_answers(self):
+        """
+        Store the answers selected for the question on screen
+        """
+        answers = [
+            idx for idx, choice in enumerate(self._question_frame.choices)
+            if choice.get()
+        ]
+        if answers:
+            self._answers[self._curr_idx] = answers
+        else:
+            self._answers.pop(self._curr_idx, None)
+
     def _btn_handler(self, inc):
         """
-        Hide or show frames based of the current index
+        Show the question at the new index in the reused frame
         """
-        self._questions_frames[self._curr_idx].pack_forget()
+        self._save_answers()
         self._curr_idx = (self._curr_idx + inc) % self._num_of_questions
-        self._idx_label.configure(
-            text=f"{self._curr_idx + 1}/{self._num_of_questions}",
+        self._show_question(
+            self._quiz.questions[self._curr_idx],
+            user_answers=self._answers.get(self._curr_idx, []),
         )
+        self._update_navigation()
         self._idx_label.update()
-        self._questions_frames[self._curr_idx].pack()
-
-        prev_state, next_state = tk.NORMAL, tk.NORMAL
-        prev_cursor, next_cursor = "hand1", "hand1"
-        if self._curr_idx == 0:
-            prev_state = tk.DISABLED
-            prev_cursor = ""
-        if self._curr_idx == self._num_of_questions - 1:
-            next_state = tk.DISABLED
-            next_cursor = ""
-
-        self._prev_btn.config(state=prev_state, cursor=prev_cursor)
-        self._next_btn.config(state=next_state, cursor=next_cursor)
-
-    def _prev_handler(self):
-        """
-        Go to the previous question
-        """
-        if self._curr_idx == 0:
-            return
-        self._btn_handler(-1)
-
-    def _next_handler(self):
-        """
-        Go to the next question
-        """
-        if self._curr_idx == self._num_of_questions - 1:
-            return
-        self._btn_handler(1)
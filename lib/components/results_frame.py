@@ -25,69 +25,185 @@ class ResultsFrame(QuittableFrame):
     """
     Display results of the test
     """
+    # Metrics broken down by label, in the order of the columns of the table
+    LABEL_HEADS = (
+        HeaderText.RATIO,
+        HeaderText.ONLY_CORRECT_RATIO,
+        HeaderText.TOTALLY_CORRECT,
+        HeaderText.PARTIALLY_CORRECT,
+        HeaderText.TOTALLY_WRONG,
+    )
+
     def __init__(self, parent, quiz, summary):
         super().__init__(parent)
 
         self._parent = parent
+        self._quiz = None
+        self._summary = None
+
+        # Widgets are allocated once and filled with the results of every
+        # session, growing only when a summary needs more rows
+        self._entries = []
+        self._label_rows = []
+        self._table = tk.Frame(self, bg="white", bd=2, relief=tk.RIDGE)
+        for col, text in enumerate(
+            ["Label"] + [head.value.title() for head in self.LABEL_HEADS],
+        ):
+            tk.Label(
+                self._table,
+                text=text,
+                font=("Arial", 10, "bold"),
+                bg="white",
+            ).grid(row=0, column=col, padx=5)
+
+        self._buttons = tk.Frame(self)
+        buttons = []
+        for text, command in (
+            ("View Correction", self._handle_view_answers),
+            ("View Mistakes", self._handle_view_mistakes),
+            ("Export", self._handle_export),
+            ("Quit", self.handle_quit),
+        ):
+            btn = tk.Button(
+                master=self._buttons,
+                text=text,
+                font=("Arial", 12),
+                height=2,
+                cursor="hand1",
+                bg="black",
+                fg="orange",
+                activebackground="orange",
+                activeforeground="black",
+                command=command,
+            )
+            btn.pack(side=tk.LEFT, padx=20)
+            buttons.append(btn)
+        self._mistakes_btn = buttons[1]
+
+        self.reset(quiz, summary)
+
+    def show(self):
+        """
+        Put the results on the window
+        """
+        self.pack(side=tk.BOTTOM, expand=True, pady=20)
+
+    def reset(self, quiz, summary):
+        """
+        Display the results of another session
+        """
         self._quiz = quiz
         self._summary = summary
 
         self._log_summary()
 
+        shown = 0
         for idx, (head, value) in enumerate(self._summary.items()):
-            if head == HeaderText.RESULTS:
+            if head in (HeaderText.RESULTS, HeaderText.LABELS):
                 continue
-            t_entry = tk.Entry(self, font=('Arial', '14'), bd=2)
-            t_entry.grid(row=idx, column=0, padx=20, pady=3)
-            t_entry.insert(tk.END, head.value.title())
-            t_entry.configure(
-                cursor="arrow",
-                state=tk.DISABLED,
-                disabledforeground="black",
-                disabledbackground="white",
-            )
-            t_entry = tk.Entry(self, font=('Arial', '14'), bd=2)
-            t_entry.grid(row=idx, column=1, padx=20, pady=3)
+            if shown == len(self._entries):
+                self._entries.append((self._new_entry(), self._new_entry()))
+            head_entry, value_entry = self._entries[shown]
+            shown += 1
             if head.name.endswith('RATIO'):
                 value = f"{value:.2%}"
-            t_entry.insert(tk.END, value)
-            t_entry.configure(
-                cursor="arrow",
-                state=tk.DISABLED,
-                disabledforeground="black",
-                disabledbackground="white",
-            )
+            elif isinstance(value, float):
+                value = f"{value:.2f}"
+            self._set_entry(head_entry, head.value.title())
+            self._set_entry(value_entry, value)
+            head_entry.grid(row=idx, column=0, padx=20, pady=3)
+            value_entry.grid(row=idx, column=1, padx=20, pady=3)
+        for head_entry, value_entry in self._entries[shown:]:
+            head_entry.grid_remove()
+            value_entry.grid_remove()
 
-        tk.Button(
-            master=self,
-            text="View Correction",
-            font=("Arial", 12),
-            height=2,
-            cursor="hand1",
-            bg="black",
-            fg="orange",
-            activebackground="orange",
-            activeforeground="black",
-            command=self._handle_view_answers,
-        ).grid(row=len(self._summary), column=0, padx=30, pady=10)
-        tk.Button(
-            master=self,
-            text="Quit",
-            font=("Arial", 12),
-            height=2,
-            cursor="hand1",
-            bg="black",
-            fg="orange",
-            activebackground="orange",
-            activeforeground="black",
-            command=super().handle_quit,
-        ).grid(row=len(self._summary), column=1, padx=30, pady=10)
+        self._fill_labels_table()
+        self._table.grid(
+            row=len(self._summary), column=0, columnspan=2, pady=10,
+        )
+
+        has_mistakes = any(
+            result < 1 for result in self._summary[HeaderText.RESULTS]
+        )
+        self._mistakes_btn.configure(
+            state=tk.NORMAL if has_mistakes else tk.DISABLED,
+            cursor="hand1" if has_mistakes else "",
+        )
+        self._buttons.grid(row=len(self._summary) + 1, column=0, columnspan=2,
+                           pady=10)
+
+    def release(self):
+        """
+        Drop the quiz and the summary of the last session
+        """
+        self._quiz = None
+        self._summary = None
+
+    def _new_entry(self):
+        """
+        Allocate a read-only cell of the results table
+        """
+        t_entry = tk.Entry(self, font=('Arial', '14'), bd=2)
+        t_entry.configure(
+            cursor="arrow",
+            state=tk.DISABLED,
+            disabledforeground="black",
+            disabledbackground="white",
+        )
+        return t_entry
+
+    @staticmethod
+    def _set_entry(t_entry, value):
+        """
+        Replace the content of a read-only cell
+        """
+        t_entry.configure(state=tk.NORMAL)
+        t_entry.delete(0, tk.END)
+        t_entry.insert(tk.END, value)
+        t_entry.configure(state=tk.DISABLED)
+
+    def _fill_labels_table(self):
+        """
+        Fill the table with the results broken down by label
+        """
+        labels = self._summary[HeaderText.LABELS]
+        for row, (label, metrics) in enumerate(labels.items(), start=1):
+            if row > len(self._label_rows):
+                self._label_rows.append([
+                    tk.Label(self._table, font=("Arial", 10), bg="white")
+                    for _ in range(len(self.LABEL_HEADS) + 1)
+                ])
+            values = [label or "-"]
+            for head in self.LABEL_HEADS:
+                value = metrics[head]
+                if head.name.endswith('RATIO'):
+                    value = f"{value:.2%}"
+                values.append(value)
+            for col, (cell, value) in enumerate(
+                zip(self._label_rows[row - 1], values),
+            ):
+                cell.configure(text=value)
+                cell.grid(row=row, column=col, padx=5)
+        for cells in self._label_rows[len(labels):]:
+            for cell in cells:
+                cell.grid_remove()
 
     def _handle_view_answers(self):
-        self.destroy()
         self._parent.show_correction()
 
+    def _handle_view_mistakes(self):
+        self._parent.show_correction(only_mistakes=True)
+
+    def _handle_export(self):
+        self._parent.export_correction()
+
     def _log_summary(self):
         print("Summary:")
         for target, value in self._summary.items():
+            if target == HeaderText.LABELS:
+                continue
             print(f"  {target.value}: {value}")
+        for label, metrics in self._summary[HeaderText.LABELS].items():
+            print(f"  [{label}]")
+            for target, value in metrics.items():
+                print(f"    {target.value}: {value}")
@@ -0,0 +1,91 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+from lib.components.navigable_frame import NavigableFrame
+from lib.enums.header_text import HeaderText
+
+
+class ReviewUI(NavigableFrame):
+    """
+    UI for reviewing the correction of a submitted quiz
+    """
+    def __init__(self, parent, quiz, summary, user_answers,
+                 only_mistakes=False):
+        super().__init__(parent)
+
+        self._parent = parent
+        self._quiz = None
+        self._user_answers = None
+        self._visible = range(0)
+
+        self._add_button("Quit", self.handle_quit)
+
+        self.reset(quiz, summary, user_answers, only_mistakes)
+
+    def reset(self, quiz, summary, user_answers, only_mistakes=False):
+        """
+        Review another submission, from its first visible question
+        """
+        if only_mistakes:
+            visible = [
+                qidx for qidx, result in enumerate(summary[HeaderText.RESULTS])
+                if result < 1
+            ]
+        else:
+            visible = range(len(summary[HeaderText.RESULTS]))
+        if len(visible) == 0:
+            raise ValueError("There are no questions to review")
+
+        self._quiz = quiz
+        self._user_answers = user_answers
+        self._curr_idx = 0
+        self._visible = visible
+        self._num_of_questions = len(visible)
+        self._show_question(
+            self._quiz.questions[visible[0]],
+            True,
+            self._user_answers[visible[0]],
+        )
+        self._update_navigation()
+
+    def release(self):
+        """
+        Drop the quiz and the answers of the last session
+        """
+        self._quiz = None
+        self._user_answers = None
+        self._visible = range(0)
+
+    def _position_text(self):
+        """
+        Position among the questions reviewed and in the whole quiz
+        """
+        return f"{super()._position_text()} " \
+               f"(question {self._visible[self._curr_idx] + 1})"
+
+    def _btn_handler(self, inc):
+        """
+        Show the question at the new position in the reused frame
+        """
+        self._curr_idx += inc
+        qidx = self._visible[self._curr_idx]
+        self._show_question(
+            self._quiz.questions[qidx],
+            True,
+            self._user_answers[qidx],
+        )
+        self._update_navigation()
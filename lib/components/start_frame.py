@@ -19,7 +19,8 @@ import tkinter as tk
 import tkinter.filedialog as fd
 from tkinter import messagebox
 
-from lib.datatypes.quiz import Quiz
+from lib.analysis.adaptive import load_difficulties
+from lib.datatypes.loader import load_quiz
 from lib.components.help_dialog import HelpDialog
 from lib.exceptions.parse_exception import ParseException
 
@@ -28,10 +29,11 @@ class StartFrame(tk.Frame):
     """
     Initial menu
     """
-    def __init__(self, parent, icon_img):
+    def __init__(self, parent, icon_img, quiz_loader=load_quiz):
         super().__init__(parent, bg='linen')
         self._parent = parent
         self._icon_img = icon_img
+        self._quiz_loader = quiz_loader
 
         tk.Button(
             master=self,
@@ -47,6 +49,19 @@ class StartFrame(tk.Frame):
             command=self._start_handler,
         ).grid(row=0, column=0, padx=30, pady=20)
 
+        tk.Button(
+            master=self,
+            text="Adaptive Quiz",
+            width=16,
+            font=("Helvetica", 16),
+            cursor="hand1",
+            bg="black",
+            fg="orange",
+            activebackground="orange",
+            activeforeground="black",
+            command=lambda: self._start_handler(adaptive=True),
+        ).grid(row=1, column=0, pady=10)
+
         tk.Button(
             master=self,
             text="About",
@@ -58,7 +73,7 @@ class StartFrame(tk.Frame):
             activebackground="orange",
             activeforeground="black",
             command=self._help_handler,
-        ).grid(row=1, column=0)
+        ).grid(row=2, column=0)
 
         tk.Button(
             master=self,
@@ -71,7 +86,19 @@ class StartFrame(tk.Frame):
             activebackground="orange",
             activeforeground="black",
             command=parent.quit,
-        ).grid(row=2, column=0, pady=10)
+        ).grid(row=3, column=0, pady=10)
+
+    def show(self):
+        """
+        Put the menu on the window
+        """
+        self.pack(side=tk.BOTTOM, expand=True)
+
+    def hide(self):
+        """
+        Take the menu off the window, keeping its widgets alive
+        """
+        self.pack_forget()
 
     def _help_handler(self):
         """
@@ -79,13 +106,15 @@ class StartFrame(tk.Frame):
         """
         HelpDialog(self, self._icon_img)
 
-    def _start_handler(self):
+    def _start_handler(self, adaptive=False):
         """
-        Handle start quiz button
+        Handle start quiz buttons
         """
 
         filetypes = (
-            ("qz files", "*.qz"),
+            ("qz files", "*.qz *.qz.gz *.qz.bz2 *.qz.xz"),
+            ("compressed qz files", "*.qz.gz *.qz.bz2 *.qz.xz"),
+            ("SQLite question banks", "*.db *.sqlite"),
             ("All files", "*.*")
         )
 
@@ -97,7 +126,7 @@ class StartFrame(tk.Frame):
                 if file is not None:
                     filename = file.name
                 print(f"Input file chosen: {filename}")
-                quiz = Quiz(filename)
+                quiz = self._quiz_loader(filename)
             except AttributeError:
                 print("No file choosen")
                 return
@@ -110,5 +139,19 @@ class StartFrame(tk.Frame):
                 filename = None
                 print(exc)
 
+        difficulties = None
+        if adaptive:
+            try:
+                difficulties = load_difficulties(
+                    filename, len(quiz.questions),
+                )
+            except ValueError as exc:
+                messagebox.showerror(
+                    title="File error",
+                    message="Difficulty table not supported or malformed!",
+                )
+                print(exc)
+                return
+
         # forward quiz data structure to the controller
-        self._parent.set_quiz(quiz)
+        self._parent.set_quiz(quiz, difficulties)
@@ -0,0 +1,78 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+
+from lib.converters.csv_converter import qz_to_csv
+from lib.converters.jsonl_converter import jsonl_to_qz, qz_to_jsonl
+from lib.datatypes.quiz import COMPRESSED_OPENERS
+from lib.exceptions.parse_exception import ParseException
+
+# Converters by source and target format
+CONVERTERS = {
+    (".qz", ".jsonl"): qz_to_jsonl,
+    (".jsonl", ".qz"): jsonl_to_qz,
+    (".qz", ".csv"): qz_to_csv,
+}
+
+
+def file_format(filename):
+    """
+    Format of a file by its extension, ignoring the compression
+    """
+    for extension in COMPRESSED_OPENERS:
+        if filename.endswith(extension):
+            filename = filename[:-len(extension)]
+            break
+    return filename[filename.rfind("."):]
+
+
+def _default_mode():
+    """
+    Permissions a new file gets under the current umask
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def convert(source, target):
+    """
+    Convert a file into another format, chosen by their extensions. The
+    result is written next to the target and moved over it only once
+    complete, so a failure never touches an existing target
+    """
+    converter = CONVERTERS.get((file_format(source), file_format(target)))
+    if converter is None:
+        raise ParseException(
+            f"Cannot convert from {file_format(source)} to "
+            f"{file_format(target)}",
+        )
+    directory, name = os.path.split(os.path.abspath(target))
+    # The temporary file ends with the name of the target, so that it is
+    # compressed the same way
+    handle, partial = tempfile.mkstemp(prefix=".", suffix=f".{name}",
+                                       dir=directory)
+    os.close(handle)
+    try:
+        converter(source, partial)
+        os.chmod(partial, _default_mode())
+        os.replace(partial, target)
+    except BaseException:
+        os.remove(partial)
+        raise
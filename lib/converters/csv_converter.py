@@ -0,0 +1,56 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+from itertools import islice
+
+from lib.datatypes.quiz import MAX_ANSWERS, iter_questions, open_quiz_file
+
+HEADER = (
+    ["label", "question"] +
+    [f"answer_{aidx + 1}" for aidx in range(MAX_ANSWERS)] +
+    ["correct_answers"]
+)
+
+
+def question_to_csv_row(question):
+    """
+    Encode a question as a CSV row with one answer per column. Correct
+    answers are listed by their 1-based column number, separated by spaces
+    """
+    return (
+        [question.label, question.text] +
+        question.answers +
+        [""] * (MAX_ANSWERS - question.number_of_answers) +
+        [" ".join(str(aidx + 1) for aidx in question.correct_answers)]
+    )
+
+
+def qz_to_csv(qz_filename, csv_filename, batch_size=10000):
+    """
+    Convert a quiz file into CSV, writing the questions in batches
+    """
+    rows = (question_to_csv_row(question)
+            for question in iter_questions(qz_filename))
+    with open_quiz_file(csv_filename, "w") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(HEADER)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            writer.writerows(batch)
@@ -0,0 +1,225 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import html
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+
+from lib.enums.header_text import HeaderText
+
+_STYLE = """
+body { font-family: Arial, sans-serif; margin: 2em; }
+table { border-collapse: collapse; margin-bottom: 2em; }
+td { border: 1px solid #999; padding: 2px 10px; }
+.question { break-inside: avoid; page-break-inside: avoid; }
+.text { font-weight: bold; white-space: pre-wrap; }
+.label { color: #666; font-weight: normal; }
+ul { list-style: none; font-family: Courier, monospace; }
+li { white-space: pre-wrap; margin: 4px 0; }
+.right { color: green; }
+.wrong { color: red; }
+@media print { body { margin: 0; } a { display: none; } }
+"""
+
+# Boxes drawn next to the answers, unticked and ticked
+_BOXES = ("&#9744;", "&#9745;")
+
+
+def _page_head(title):
+    """
+    Opening of a self-contained page, with its style inline
+    """
+    title = html.escape(title)
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n"
+        "<meta charset=\"utf-8\">\n"
+        f"<title>{title}</title>\n<style>{_STYLE}</style>\n"
+        f"</head>\n<body>\n<h1>{title}</h1>\n"
+    )
+
+
+_PAGE_TAIL = "</body>\n</html>\n"
+
+
+def render_summary(summary):
+    """
+    Render the global results of a graded session as a table
+    """
+    rows = []
+    for head, value in summary.items():
+        if head in (HeaderText.RESULTS, HeaderText.LABELS):
+            continue
+        if head.name.endswith('RATIO'):
+            value = f"{value:.2%}"
+        elif isinstance(value, float):
+            value = f"{value:.2f}"
+        rows.append(
+            f"<tr><td>{html.escape(head.value.title())}</td>"
+            f"<td>{value}</td></tr>\n",
+        )
+    return f"<table>\n{''.join(rows)}</table>\n"
+
+
+def render_question(number, question, user_answers=None):
+    """
+    Render a question as HTML. When the answers of a graded session are
+    given, they are ticked and colored as in the correction: green when
+    correct and chosen, red when correct but missed or chosen but wrong
+    """
+    label = ""
+    if question.label:
+        label = f" <span class=\"label\">[{html.escape(question.label)}]" \
+                "</span>"
+    parts = [
+        f"<div class=\"question\">\n<p class=\"text\">{number}. "
+        f"{html.escape(question.text)}{label}</p>\n<ul>\n",
+    ]
+    for idx, ans in enumerate(question.answers):
+        css = ""
+        chosen = False
+        if user_answers is not None:
+            chosen = idx in user_answers
+            if idx in question.correct_answers and chosen:
+                css = " class=\"right\""
+            elif idx in question.correct_answers or chosen:
+                css = " class=\"wrong\""
+        parts.append(
+            f"<li{css}>{_BOXES[chosen]} {html.escape(ans)}</li>\n",
+        )
+    parts.append("</ul>\n</div>\n")
+    return "".join(parts)
+
+
+def export_html(questions, filename, user_answers=None, answer_key=False,
+                title="Quiz", summary=None, start=1):
+    """
+    Write questions to a printable HTML page one at a time, so the memory
+    used does not depend on their number. Without answers it is a blank
+    exam, with answer_key the correct answers are ticked, and with the
+    answers of a graded session (and optionally its summary) it is the
+    correction. Questions are numbered from start
+    """
+    if answer_key and user_answers is not None:
+        raise ValueError("An answer key cannot show the answers of a session")
+
+    if user_answers is None:
+        user_answers = repeat(None)
+    try:
+        with open(filename, "w", encoding="utf8") as out:
+            out.write(_page_head(title))
+            if summary is not None:
+                out.write(render_summary(summary))
+            for number, (question, answers) in enumerate(
+                zip(questions, user_answers), start=start,
+            ):
+                if answer_key:
+                    answers = question.correct_answers
+                out.write(render_question(number, question, answers))
+            out.write(_PAGE_TAIL)
+    except BaseException:
+        # Do not leave a truncated page behind
+        if os.path.exists(filename):
+            os.remove(filename)
+        raise
+
+
+def _export_chunk(args):
+    """
+    Write a chunk of questions in a worker process
+    """
+    questions, filename, user_answers, answer_key, title, start = args
+    export_html(questions, filename, user_answers, answer_key, title,
+                start=start)
+    return filename
+
+
+def _write_index(directory, filenames, title):
+    """
+    Write a page linking the chunks in order
+    """
+    links = "".join(
+        f"<li><a href=\"{html.escape(os.path.basename(filename))}\">"
+        f"{html.escape(os.path.basename(filename))}</a></li>\n"
+        for filename in filenames
+    )
+    with open(os.path.join(directory, "index.html"), "w",
+              encoding="utf8") as out:
+        out.write(f"{_page_head(title)}<ul>\n{links}</ul>\n{_PAGE_TAIL}")
+
+
+def _iter_chunks(questions, directory, chunk_size, user_answers,
+                 answer_key, title):
+    """
+    Read the questions lazily, yielding the arguments of each chunk
+    """
+    questions = iter(questions)
+    if user_answers is not None:
+        user_answers = iter(user_answers)
+    start = 1
+    while True:
+        chunk = list(islice(questions, chunk_size))
+        if not chunk:
+            return
+        answers = None
+        if user_answers is not None:
+            answers = list(islice(user_answers, len(chunk)))
+        yield (
+            chunk,
+            os.path.join(directory, f"questions_{start:08d}.html"),
+            answers,
+            answer_key,
+            f"{title} ({start}-{start + len(chunk) - 1})",
+            start,
+        )
+        start += len(chunk)
+
+
+def export_html_chunks(questions, directory, chunk_size=10000,
+                       user_answers=None, answer_key=False, title="Quiz",
+                       workers=None):
+    """
+    Split the export of many questions into pages of chunk_size questions,
+    rendered in parallel by worker processes, and link them from an index.
+    Only a couple of chunks per worker are in memory at a time. Return the
+    paths of the pages in order
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunks must contain at least a question")
+
+    os.makedirs(directory, exist_ok=True)
+    chunks = _iter_chunks(
+        questions, directory, chunk_size, user_answers, answer_key, title,
+    )
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        # Shipping the chunks to a single worker would only add overhead
+        filenames = [_export_chunk(args) for args in chunks]
+    else:
+        filenames = []
+        with ProcessPoolExecutor(workers) as pool:
+            pending = deque()
+            for args in chunks:
+                pending.append(pool.submit(_export_chunk, args))
+                if len(pending) >= 2 * workers:
+                    filenames.append(pending.popleft().result())
+            while pending:
+                filenames.append(pending.popleft().result())
+
+    _write_index(directory, filenames, title)
+    return filenames
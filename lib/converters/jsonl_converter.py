@@ -0,0 +1,114 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from itertools import islice
+
+from lib.datatypes.question import Question
+from lib.datatypes.quiz import (
+    iter_questions, open_quiz_file, question_to_row, write_rows,
+)
+from lib.exceptions.parse_exception import ParseException
+
+
+def question_to_record(question):
+    """
+    Encode a question as a JSON object
+    """
+    return {
+        "label": question.label,
+        "text": question.text,
+        "answers": question.answers,
+        "correct_answers": question.correct_answers,
+    }
+
+
+def record_to_question(record):
+    """
+    Decode a question from a JSON object
+    """
+    if not isinstance(record, dict):
+        raise ParseException("Questions must be JSON objects")
+    try:
+        label = record.get("label", "")
+        text = record["text"]
+        answers = record["answers"]
+        correct_answers = record["correct_answers"]
+    except KeyError as exc:
+        raise ParseException(f"Missing field {exc}") from exc
+    if not (
+        isinstance(label, str) and isinstance(text, str) and
+        isinstance(answers, list) and isinstance(correct_answers, list) and
+        all(isinstance(ans, str) for ans in answers) and
+        all(type(aidx) is int for aidx in correct_answers)
+    ):
+        raise ParseException("Fields have the wrong type")
+    try:
+        return Question(text, answers, correct_answers, label)
+    except ValueError as exc:
+        raise ParseException(str(exc)) from exc
+
+
+def _iter_converted(jsonl_filename, convert):
+    """
+    Parse a JSON Lines file one line at a time, yielding the converted
+    questions and reporting the line of any error
+    """
+    with open_quiz_file(jsonl_filename) as jsonl_file:
+        for i, line in enumerate(jsonl_file):
+            if not line.strip():
+                continue
+            try:
+                yield convert(record_to_question(json.loads(line)))
+            except (ValueError, ParseException) as exc:
+                raise ParseException(f"Error at line {i+1}: {exc}") from exc
+
+
+def iter_records(jsonl_filename):
+    """
+    Parse a JSON Lines file one line at a time, yielding its questions
+    """
+    return _iter_converted(jsonl_filename, lambda question: question)
+
+
+def qz_to_jsonl(qz_filename, jsonl_filename, batch_size=10000):
+    """
+    Convert a quiz file into JSON Lines, writing the questions in batches
+    """
+    records = (
+        json.dumps(question_to_record(question), ensure_ascii=False) + "\n"
+        for question in iter_questions(qz_filename)
+    )
+    with open_quiz_file(jsonl_filename, "w") as jsonl_file:
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            jsonl_file.writelines(batch)
+
+
+def jsonl_to_qz(jsonl_filename, qz_filename, batch_size=10000):
+    """
+    Convert JSON Lines into a quiz file, writing the questions in batches
+    """
+    rows = _iter_converted(jsonl_filename, question_to_row)
+    with open_quiz_file(qz_filename, "w") as qz_file:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            write_rows(qz_file, batch)
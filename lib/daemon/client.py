@@ -0,0 +1,117 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import gc
+import json
+import os
+import socket
+import struct
+import zlib
+
+from lib.daemon.server import ERROR, HEADER
+from lib.datatypes.loader import load_quiz
+from lib.datatypes.question import Question
+from lib.datatypes.quiz import Quiz
+from lib.datatypes.sqlite_quiz import SQLITE_EXTENSIONS
+from lib.exceptions.parse_exception import ParseException
+
+
+def _receive(sock, size):
+    """
+    Read exactly the given number of bytes from a socket
+    """
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed by the daemon")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _check_owner(sock, socket_path):
+    """
+    Make sure the daemon is run by the same user, since anyone can create
+    a socket at the default path before the daemon does
+    """
+    if hasattr(socket, "SO_PEERCRED"):
+        _pid, uid, _gid = struct.unpack("3i", sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"),
+        ))
+    else:
+        uid = os.stat(socket_path).st_uid
+    if uid != os.getuid():
+        raise ConnectionError(
+            f"{socket_path} belongs to another user, not trusting it",
+        )
+
+
+def request_quiz(filename, socket_path, timeout=30):
+    """
+    Ask the daemon for the quiz stored in the given file, giving up when it
+    does not answer within the timeout (in seconds) at any step
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        _check_owner(sock, socket_path)
+        sock.sendall(
+            json.dumps({"path": os.path.abspath(filename)}).encode("utf8") +
+            b"\n",
+        )
+        status, size = HEADER.unpack(_receive(sock, HEADER.size))
+        payload = _receive(sock, size)
+
+    if status == ERROR:
+        raise ParseException(payload.decode("utf8"))
+
+    # Nothing allocated here can form reference cycles, so the collector
+    # would only slow down the creation of many small objects
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return Quiz.from_questions(
+            Question(text, answers, correct_answers, label)
+            for label, text, answers, correct_answers in
+            json.loads(zlib.decompress(payload))
+        )
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def make_client_loader(socket_path):
+    """
+    Build a quiz loader that goes through the daemon, falling back to parsing
+    the file locally when the daemon is not running or cannot be used
+    """
+    def load(filename):
+        if not filename:
+            raise AttributeError(f"No file choosen: {filename}")
+        # Databases are already loaded on demand, there is nothing to cache
+        if filename.endswith(SQLITE_EXTENSIONS):
+            return load_quiz(filename)
+        # Also sockets of other users, which may refuse the connection, and
+        # daemons not answering in time
+        try:
+            return request_quiz(filename, socket_path)
+        except OSError as exc:
+            print(f"Daemon not available, loading locally: {exc}")
+            return load_quiz(filename)
+
+    return load
@@ -0,0 +1,171 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+
+from lib.datatypes.quiz import Quiz
+
+# Header of a response: status (OK or ERROR) and length of the payload
+HEADER = struct.Struct("!cQ")
+OK, ERROR = b"O", b"E"
+
+
+def default_socket_path():
+    """
+    Per-user path of the socket the daemon listens on
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"quiz-helper-{os.getuid()}.sock")
+
+
+def encode_quiz(filename):
+    """
+    Parse a quiz file into the compact form sent to the clients: the fields
+    of its questions as compressed JSON, which unlike a pickle cannot run
+    code when decoded
+    """
+    return zlib.compress(
+        json.dumps(
+            [
+                [
+                    question.label,
+                    question.text,
+                    question.answers,
+                    question.correct_answers,
+                ]
+                for question in Quiz(filename).questions
+            ],
+            separators=(",", ":"),
+        ).encode("utf8"),
+        1,
+    )
+
+
+class QuizCache:
+    """
+    LRU cache of parsed quizzes, kept within a memory budget in their
+    compact form, and rebuilt when their file changes
+    """
+    def __init__(self, budget):
+        self._budget = budget
+        self._used = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, filename):
+        """
+        Compact form of the quiz stored in the given file
+        """
+        stat = os.stat(filename)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(filename)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(filename)
+                return entry[1]
+
+        # Parsing can take seconds, so it must not hold up the requests for
+        # other quizzes
+        payload = encode_quiz(filename)
+
+        with self._lock:
+            entry = self._entries.pop(filename, None)
+            if entry is not None:
+                self._used -= len(entry[1])
+            if len(payload) <= self._budget:
+                self._entries[filename] = (version, payload)
+                self._used += len(payload)
+                while self._used > self._budget:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._used -= len(evicted)
+        print(f"Loaded {filename} ({len(payload)} bytes)", flush=True)
+        return payload
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answer a single request for a quiz
+    """
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            status, payload = OK, self.server.cache.get(request["path"])
+        except Exception as exc:  # the error is reported to the client
+            status, payload = ERROR, str(exc).encode("utf8")
+        self.wfile.write(HEADER.pack(status, len(payload)))
+        self.wfile.write(payload)
+
+
+class QuizDaemon(socketserver.ThreadingUnixStreamServer):
+    """
+    Resident process keeping recently used quizzes ready to be served
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path, budget):
+        self.cache = QuizCache(budget)
+        if os.path.exists(socket_path):
+            _remove_stale_socket(socket_path)
+
+        # Only the user running the daemon can connect to it
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def _remove_stale_socket(socket_path):
+    """
+    Remove the socket left behind by a daemon that is no longer running
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+            return
+    raise OSError(f"A daemon is already listening on {socket_path}")
+
+
+def run_daemon(socket_path, budget):
+    """
+    Serve quizzes until interrupted
+    """
+    # Stop cleanly, removing the socket, also when terminated by a signal
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: sys.exit(0))
+    with QuizDaemon(socket_path, budget) as daemon:
+        print(f"Listening on {socket_path}", flush=True)
+        try:
+            daemon.serve_forever()
+        except (KeyboardInterrupt, SystemExit):
+            print("Daemon stopped")
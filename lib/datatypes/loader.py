@@ -0,0 +1,28 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+from lib.datatypes.quiz import Quiz
+from lib.datatypes.sqlite_quiz import SQLITE_EXTENSIONS, SqliteQuiz
+
+
+def load_quiz(filename):
+    """
+    Load a quiz from a quiz file or from a SQLite question bank
+    """
+    if filename and filename.endswith(SQLITE_EXTENSIONS):
+        return SqliteQuiz(filename)
+    return Quiz(filename)
@@ -15,7 +15,10 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see <https://www.gnu.org/licenses/>.
 
+import bz2
 import csv
+import gzip
+import lzma
 
 from lib.exceptions.parse_exception import ParseException
 from lib.datatypes.question import Question
@@ -41,107 +44,246 @@ class Quiz:
         """
         return self._questions
 
-    def _from_file(self, filename):
+    @classmethod
+    def from_questions(cls, questions):
         """
-        Read questions of the quiz from file
+        Build a quiz from questions already parsed
         """
-        lines = []
-        with open(filename, "r", encoding="utf8") as quiz_file:
-            reader = csv.reader(quiz_file, delimiter=",")
-            lines = list(reader)
-
-        if len(lines) < 1:
-            raise ParseException("Quiz should contain at least a question")
-
-        for i, line in enumerate(lines):
-            if len(line) == 0 or line[0].startswith("#"):
-                continue
-            if len(line) != 3:
-                raise ParseException(f"Error at line {i+1}: Wrong # of fields")
-            label = line[0]
-            text = line[1]
-            answers, correct_answers = self._parse_answers(line[2])
-            self._questions.append(
-                Question(text, answers, correct_answers, label),
-            )
-            self._num_of_questions += 1
-            # self._questions[i].log()
+        quiz = cls.__new__(cls)
+        quiz._questions = list(questions)
+        quiz._num_of_questions = len(quiz._questions)
+        return quiz
 
-    def _parse_answers(self, line):
+    def subset(self, indices):
         """
-        Collect the answers and separate the correct ones
+        Build a quiz made only of the questions at the given indices
         """
-        answers, correct_answers = [], []
-        fields = line.split(":")[:7]
-        for i, field in enumerate(fields):
-            if field.startswith("@"):
-                field = field[1:]
-                correct_answers.append(i)
-            answers.append(field)
-
-        if len(correct_answers) == 0:
-            raise ParseException("Questions have at least one correct answer")
+        return Quiz.from_questions(self._questions[qidx] for qidx in indices)
 
-        return answers, correct_answers
+    def _from_file(self, filename):
+        """
+        Read questions of the quiz from file
+        """
+        for question in iter_questions(filename):
+            self._questions.append(question)
+            self._num_of_questions += 1
 
     def compute_results(self, user_answers):
         """
-        Calculate the results of the tests and return a small summary
+        Calculate the results of the tests and return a small summary, both
+        global and broken down by label
         """
         if len(user_answers) != self._num_of_questions:
             raise ValueError("Wrong number of answers")
 
         results = []
-        correct, total = 0, 0
-        only_correct, only_correct_total = 0, 0
-        for qidx, question in enumerate(self._questions):
+        per_label = {}
+        for question, answers in zip(self._questions, user_answers):
+            correct_answers = question.correct_answers
             n_ans = len(question.answers)
-            only_c = len(question.correct_answers)
-            total += n_ans
-            only_correct_total += only_c
-            if question.correct_answers == user_answers[qidx]:
-                results.append(1)
-                correct += n_ans
-                only_correct += only_c
-                continue
-
-            got_result = False
-            for aidx, _ in enumerate(question.answers):
-                if (
-                    aidx in question.correct_answers and
-                    aidx in user_answers[qidx]
-                ):
-                    if not got_result:
-                        got_result = True
-                        results.append(0)
-                    correct += 1
-                    only_correct += 1
-                elif (
-                    aidx not in question.correct_answers and
-                    aidx not in user_answers[qidx]
-                ):
-                    correct += 1
-            if not got_result:
-                results.append(-1)
-
-        return {
-            HeaderText.RESULTS: results,
-            HeaderText.CORRECT: correct,
-            HeaderText.TOTAL: total,
-            HeaderText.RATIO: correct / total,
-            HeaderText.ONLY_CORRECT: only_correct,
-            HeaderText.ONLY_CORRECT_TOTAL: only_correct_total,
-            HeaderText.ONLY_CORRECT_RATIO: only_correct / only_correct_total,
-            HeaderText.TOTALLY_CORRECT: len(
-                list(filter(lambda x: x > 0, results)),
-            ),
-            HeaderText.PARTIALLY_CORRECT: len(
-                list(filter(lambda x: x == 0, results)),
-            ),
-            HeaderText.TOTALLY_WRONG: len(
-                list(filter(lambda x: x < 0, results)),
-            ),
-            HeaderText.TOTALLY_CORRECT_RATIO: len(
-                list(filter(lambda x: x > 0, results)),
-            ) / len(self._questions)
+            only_c = len(correct_answers)
+            if correct_answers == answers:
+                outcome = 1
+                correct, only_correct = n_ans, only_c
+            else:
+                outcome = -1
+                correct, only_correct = 0, 0
+                for aidx in range(n_ans):
+                    if aidx in correct_answers:
+                        if aidx in answers:
+                            outcome = 0
+                            correct += 1
+                            only_correct += 1
+                    elif aidx not in answers:
+                        correct += 1
+            results.append(outcome)
+
+            # Labels are few, so only the per-label counters are updated here
+            # and the global totals are obtained by summing them at the end
+            counters = per_label.get(question.label)
+            if counters is None:
+                counters = per_label[question.label] = _new_counters()
+            counters[_CORRECT] += correct
+            counters[_TOTAL] += n_ans
+            counters[_ONLY_CORRECT] += only_correct
+            counters[_ONLY_CORRECT_TOTAL] += only_c
+            counters[_OUTCOMES + outcome] += 1
+
+        totals = [
+            sum(slot) for slot in zip(*per_label.values())
+        ] or _new_counters()
+        summary = {HeaderText.RESULTS: results}
+        summary.update(_summarize(totals))
+        summary[HeaderText.LABELS] = {
+            label: _summarize(counters)
+            for label, counters in per_label.items()
         }
+        return summary
+
+
+# Maximum number of answers a question can have, extra ones are dropped
+MAX_ANSWERS = 7
+
+# Bit set in an answers mask when the answers cannot be totally correct even
+# if the selected options match, e.g. unsorted or out of range indices
+NOT_CANONICAL = 1 << MAX_ANSWERS
+
+# Decompressors used to stream compressed quiz files, by file extension
+COMPRESSED_OPENERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+
+def answers_to_mask(num_of_answers, user_answers):
+    """
+    Encode the answers given to a question with the given number of answers
+    as a bitmask of selected options
+    """
+    mask = 0
+    prev = -1
+    for aidx in user_answers:
+        if 0 <= aidx < num_of_answers:
+            mask |= 1 << aidx
+            if aidx <= prev:
+                mask |= NOT_CANONICAL
+        else:
+            mask |= NOT_CANONICAL
+        prev = aidx
+    return mask
+
+
+def open_quiz_file(filename, mode="r"):
+    """
+    Open a quiz file as text, (de)compressing it on the fly if needed
+    """
+    for extension, opener in COMPRESSED_OPENERS.items():
+        if filename.endswith(extension):
+            return opener(filename, f"{mode}t", encoding="utf8", newline="")
+    return open(filename, mode, encoding="utf8", newline="")
+
+
+def iter_questions(filename):
+    """
+    Parse a quiz file one line at a time, yielding its questions
+    """
+    with open_quiz_file(filename) as quiz_file:
+        reader = csv.reader(quiz_file, delimiter=",")
+        try:
+            empty = True
+            for i, line in enumerate(reader):
+                empty = False
+                if len(line) == 0 or line[0].startswith("#"):
+                    continue
+                if len(line) != 3:
+                    raise ParseException(
+                        f"Error at line {i+1}: Wrong # of fields",
+                    )
+                label = line[0]
+                text = line[1]
+                answers, correct_answers = _parse_answers(line[2])
+                yield Question(text, answers, correct_answers, label)
+        except (EOFError, lzma.LZMAError, gzip.BadGzipFile) as exc:
+            raise ParseException(f"Corrupted compressed file: {exc}") from exc
+        except OSError as exc:
+            # bz2 reports a corrupted stream with a bare OSError
+            raise ParseException(f"Cannot read quiz file: {exc}") from exc
+
+    if empty:
+        raise ParseException("Quiz should contain at least a question")
+
+
+def question_to_row(question):
+    """
+    Encode a question as the fields of a line of a quiz file, checking that
+    it is read back unchanged
+    """
+    if question.label.startswith("#"):
+        raise ParseException("Labels cannot start with '#'")
+    if question.number_of_answers > MAX_ANSWERS:
+        raise ParseException(f"Questions have at most {MAX_ANSWERS} answers")
+    if question.correct_answers != sorted(set(question.correct_answers)) or \
+            not 0 <= question.correct_answers[0] <= \
+            question.correct_answers[-1] < question.number_of_answers:
+        raise ParseException("Correct answers must be distinct valid indices")
+
+    fields = []
+    for aidx, ans in enumerate(question.answers):
+        if ":" in ans:
+            raise ParseException("Answers cannot contain ':'")
+        if aidx in question.correct_answers:
+            ans = f"@{ans}"
+        elif ans.startswith("@"):
+            raise ParseException("Wrong answers cannot start with '@'")
+        fields.append(ans)
+    return [question.label, question.text, ":".join(fields)]
+
+
+def write_rows(quiz_file, rows):
+    """
+    Write lines of a quiz file. Fields with a carriage return are not quoted
+    by the csv module unless it is in the line terminator, so the rows
+    containing one are written with all their fields quoted
+    """
+    writer = csv.writer(quiz_file, lineterminator="\n")
+    quoting_writer = csv.writer(
+        quiz_file, lineterminator="\n", quoting=csv.QUOTE_ALL,
+    )
+    for row in rows:
+        if any("\r" in field for field in row):
+            quoting_writer.writerow(row)
+        else:
+            writer.writerow(row)
+
+
+def _parse_answers(line):
+    """
+    Collect the answers and separate the correct ones
+    """
+    answers, correct_answers = [], []
+    fields = line.split(":")[:MAX_ANSWERS]
+    for i, field in enumerate(fields):
+        if field.startswith("@"):
+            field = field[1:]
+            correct_answers.append(i)
+        answers.append(field)
+
+    if len(correct_answers) == 0:
+        raise ParseException("Questions have at least one correct answer")
+
+    return answers, correct_answers
+
+
+# Slots of the counters accumulated while grading. The outcome of a question
+# (-1, 0 or 1) is used as an offset from _OUTCOMES.
+_CORRECT, _TOTAL, _ONLY_CORRECT, _ONLY_CORRECT_TOTAL = range(4)
+_OUTCOMES = 5
+
+
+def _new_counters():
+    """
+    Fresh set of counters for a group of questions
+    """
+    return [0] * 7
+
+
+def _summarize(counters):
+    """
+    Turn the counters of a group of questions into the summary metrics
+    """
+    totally_correct = counters[_OUTCOMES + 1]
+    num_of_questions = sum(counters[_OUTCOMES - 1:_OUTCOMES + 2])
+    return {
+        HeaderText.CORRECT: counters[_CORRECT],
+        HeaderText.TOTAL: counters[_TOTAL],
+        HeaderText.RATIO: counters[_CORRECT] / counters[_TOTAL],
+        HeaderText.ONLY_CORRECT: counters[_ONLY_CORRECT],
+        HeaderText.ONLY_CORRECT_TOTAL: counters[_ONLY_CORRECT_TOTAL],
+        HeaderText.ONLY_CORRECT_RATIO:
+            counters[_ONLY_CORRECT] / counters[_ONLY_CORRECT_TOTAL],
+        HeaderText.TOTALLY_CORRECT: totally_correct,
+        HeaderText.PARTIALLY_CORRECT: counters[_OUTCOMES],
+        HeaderText.TOTALLY_WRONG: counters[_OUTCOMES - 1],
+        HeaderText.TOTALLY_CORRECT_RATIO: totally_correct / num_of_questions,
+    }
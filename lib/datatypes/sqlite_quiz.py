@@ -0,0 +1,332 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import islice
+from pathlib import Path
+
+from lib.datatypes.question import Question
+from lib.datatypes.quiz import (
+    MAX_ANSWERS, Quiz, answers_to_mask, iter_questions, _summarize,
+)
+from lib.enums.header_text import HeaderText
+from lib.exceptions.parse_exception import ParseException
+
+# Extensions of the question banks stored in SQLite databases
+SQLITE_EXTENSIONS = (".db", ".sqlite")
+
+_SCHEMA = """
+CREATE TABLE questions (
+    id INTEGER PRIMARY KEY,
+    label TEXT NOT NULL,
+    text TEXT NOT NULL,
+    answers TEXT NOT NULL,
+    correct_mask INTEGER NOT NULL,
+    num_of_answers INTEGER NOT NULL,
+    num_of_correct INTEGER NOT NULL
+);
+CREATE TABLE popcount (
+    mask INTEGER PRIMARY KEY,
+    bits INTEGER NOT NULL
+);
+"""
+
+# Grading of every question against the mask of the answers given. The
+# popcount table makes up for the lack of a bit count function in SQLite
+_GRADE = """
+CREATE TEMP TABLE graded AS
+SELECT q.id AS id, q.label AS label, q.num_of_answers AS num_of_answers,
+    q.num_of_correct AS num_of_correct,
+    CASE
+        WHEN s.mask = q.correct_mask THEN 1
+        WHEN s.mask & q.correct_mask != 0 THEN 0
+        ELSE -1
+    END AS outcome,
+    CASE
+        WHEN s.mask = q.correct_mask THEN q.num_of_answers
+        ELSE hit.bits + miss.bits
+    END AS correct,
+    CASE
+        WHEN s.mask = q.correct_mask THEN q.num_of_correct
+        ELSE hit.bits
+    END AS only_correct
+FROM questions AS q
+JOIN temp.submission AS s ON s.id = q.id
+JOIN popcount AS hit ON hit.mask = s.mask & q.correct_mask
+JOIN popcount AS miss
+    ON miss.mask = ~(s.mask | q.correct_mask) & ((1 << q.num_of_answers) - 1)
+"""
+
+# Aggregation of the graded questions by label, in order of appearance. The
+# columns follow the layout of the counters used by Quiz.compute_results
+_AGGREGATE = """
+SELECT label, SUM(correct), SUM(num_of_answers), SUM(only_correct),
+    SUM(num_of_correct), SUM(outcome = -1), SUM(outcome = 0),
+    SUM(outcome = 1)
+FROM temp.graded
+GROUP BY label
+ORDER BY MIN(id)
+"""
+
+
+def import_quiz(qz_filename, db_filename, batch_size=10000):
+    """
+    Import a quiz file into a new SQLite database, one batch of questions at
+    a time
+    """
+    if os.path.exists(db_filename):
+        raise FileExistsError(f"Database already exists: {db_filename}")
+
+    connection = sqlite3.connect(db_filename)
+    try:
+        with connection:
+            connection.executescript(_SCHEMA)
+            connection.executemany(
+                "INSERT INTO popcount VALUES (?, ?)",
+                (
+                    (mask, bin(mask).count("1"))
+                    for mask in range(1 << MAX_ANSWERS)
+                ),
+            )
+            rows = (
+                (
+                    qidx,
+                    question.label,
+                    question.text,
+                    json.dumps(question.answers),
+                    answers_to_mask(
+                        question.number_of_answers, question.correct_answers,
+                    ),
+                    question.number_of_answers,
+                    len(question.correct_answers),
+                )
+                for qidx, question in enumerate(iter_questions(qz_filename))
+            )
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                connection.executemany(
+                    "INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    batch,
+                )
+    except BaseException:
+        connection.close()
+        os.remove(db_filename)
+        raise
+    connection.close()
+
+
+def _to_question(row):
+    """
+    Build a question from a row of the questions table
+    """
+    label, text, answers, correct_mask = row
+    answers = json.loads(answers)
+    return Question(
+        text,
+        answers,
+        [aidx for aidx in range(len(answers)) if correct_mask >> aidx & 1],
+        label,
+    )
+
+
+class PagedQuestions(Sequence):
+    """
+    Read-only sequence of the questions of a database, loaded in pages kept
+    in a LRU cache
+    """
+    _COLUMNS = "label, text, answers, correct_mask"
+    _SELECT = f"SELECT {_COLUMNS} FROM questions"
+
+    def __init__(self, connection, size, page_size, cache_pages):
+        self._connection = connection
+        self._size = size
+        self._page_size = page_size
+        self._cache_pages = cache_pages
+        self._pages = OrderedDict()
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._size))]
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError("Question index out of range")
+
+        page_idx, offset = divmod(idx, self._page_size)
+        page = self._page(page_idx)
+
+        # Load the neighbouring page in advance when getting close to it
+        if offset >= self._page_size * 3 // 4:
+            self._page(page_idx + 1)
+        elif offset < self._page_size // 4:
+            self._page(page_idx - 1)
+        return page[offset]
+
+    def __iter__(self):
+        # Scan the table once, without going through the cache
+        cursor = self._connection.execute(f"{self._SELECT} ORDER BY id")
+        for row in cursor:
+            yield _to_question(row)
+
+    def iter_at(self, indices, batch_size=500):
+        """
+        Generate the questions at the given indices, in that order, fetching
+        them by id in batches instead of loading the pages around them
+        """
+        indices = iter(indices)
+        while True:
+            batch = list(islice(indices, batch_size))
+            if not batch:
+                return
+            rows = {
+                qid: row for qid, *row in self._connection.execute(
+                    f"SELECT id, {self._COLUMNS} FROM questions "
+                    f"WHERE id IN ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+            }
+            for idx in batch:
+                yield _to_question(rows[idx])
+
+    def _page(self, page_idx):
+        """
+        Get a page of questions, from the cache if possible
+        """
+        if not 0 <= page_idx * self._page_size < self._size:
+            return None
+        page = self._pages.get(page_idx)
+        if page is not None:
+            self._pages.move_to_end(page_idx)
+            return page
+
+        start = page_idx * self._page_size
+        page = [
+            _to_question(row) for row in self._connection.execute(
+                f"{self._SELECT} WHERE id >= ? AND id < ? ORDER BY id",
+                (start, start + self._page_size),
+            )
+        ]
+        self._pages[page_idx] = page
+        if len(self._pages) > self._cache_pages:
+            self._pages.popitem(last=False)
+        return page
+
+
+class SqliteQuiz:
+    """
+    Representation of a quiz stored in a SQLite database, whose questions are
+    loaded on demand
+    """
+    def __init__(self, filename, page_size=256, cache_pages=16):
+        if not filename:
+            raise AttributeError(f"No file choosen: {filename}")
+
+        self._connection = None
+        try:
+            # The path is escaped, since characters such as '#' or '?'
+            # would otherwise end it and drop the read-only mode
+            self._connection = sqlite3.connect(
+                f"{Path(filename).resolve().as_uri()}?mode=ro", uri=True,
+            )
+            self._num_of_questions = self._connection.execute(
+                "SELECT COUNT(*) FROM questions",
+            ).fetchone()[0]
+        except sqlite3.DatabaseError as exc:
+            if self._connection is not None:
+                self._connection.close()
+            raise ParseException(f"Not a question bank: {exc}") from exc
+        if self._num_of_questions < 1:
+            self._connection.close()
+            raise ParseException("Quiz should contain at least a question")
+
+        self._questions = PagedQuestions(
+            self._connection, self._num_of_questions, page_size, cache_pages,
+        )
+
+    @property
+    def questions(self):
+        """
+        Obtain questions
+        """
+        return self._questions
+
+    def subset(self, indices):
+        """
+        Build an in-memory quiz made only of the questions at the given
+        indices
+        """
+        return Quiz.from_questions(self._questions[qidx] for qidx in indices)
+
+    def compute_results(self, user_answers):
+        """
+        Calculate the results of the tests and return a small summary, both
+        global and broken down by label, grading inside the database
+        """
+        if len(user_answers) != self._num_of_questions:
+            raise ValueError("Wrong number of answers")
+
+        # Only the number of answers of each question is needed to encode the
+        # answers, so the questions themselves are not loaded
+        num_of_answers = self._connection.execute(
+            "SELECT num_of_answers FROM questions ORDER BY id",
+        )
+        self._connection.execute(
+            "CREATE TEMP TABLE submission "
+            "(id INTEGER PRIMARY KEY, mask INTEGER NOT NULL)",
+        )
+        try:
+            self._connection.executemany(
+                "INSERT INTO temp.submission VALUES (?, ?)",
+                (
+                    (qidx, answers_to_mask(n_ans, answers))
+                    for qidx, ((n_ans,), answers) in enumerate(
+                        zip(num_of_answers, user_answers),
+                    )
+                ),
+            )
+            self._connection.execute(_GRADE)
+            results = [
+                outcome for (outcome,) in self._connection.execute(
+                    "SELECT outcome FROM temp.graded ORDER BY id",
+                )
+            ]
+            per_label = {
+                label: list(counters) for label, *counters in
+                self._connection.execute(_AGGREGATE)
+            }
+        finally:
+            self._connection.execute("DROP TABLE IF EXISTS temp.graded")
+            self._connection.execute("DROP TABLE temp.submission")
+
+        totals = [sum(slot) for slot in zip(*per_label.values())]
+        summary = {HeaderText.RESULTS: results}
+        summary.update(_summarize(totals))
+        summary[HeaderText.LABELS] = {
+            label: _summarize(counters)
+            for label, counters in per_label.items()
+        }
+        return summary
+
@@ -0,0 +1,337 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import random
+from array import array
+from functools import lru_cache
+from itertools import permutations
+
+from lib.datatypes.question import Question
+from lib.datatypes.quiz import (
+    MAX_ANSWERS, NOT_CANONICAL, answers_to_mask, write_rows,
+    _CORRECT, _ONLY_CORRECT, _ONLY_CORRECT_TOTAL, _OUTCOMES, _TOTAL,
+    _new_counters, _summarize,
+)
+from lib.enums.header_text import HeaderText
+
+# Number of options selected in an answers mask, without the NOT_CANONICAL
+# flag
+_POPCOUNT = [bin(mask).count("1") for mask in range(NOT_CANONICAL)]
+
+
+@lru_cache(maxsize=None)
+def _permutations(num_of_answers):
+    """
+    All the orders of a given number of answers, with their inverses
+    """
+    perms = list(permutations(range(num_of_answers)))
+    inverses = []
+    for perm in perms:
+        inverse = [0] * num_of_answers
+        for shown, canonical in enumerate(perm):
+            inverse[canonical] = shown
+        inverses.append(tuple(inverse))
+    return perms, inverses
+
+
+def _tables(inverse=False):
+    """
+    Orders of the answers (or their inverses) indexed by number of answers
+    and then by rank
+    """
+    return [
+        _permutations(num_of_answers)[int(inverse)]
+        for num_of_answers in range(MAX_ANSWERS + 1)
+    ]
+
+
+def _remap(order, num_of_answers, answers):
+    """
+    Map the answers given to a question through an order of its answers,
+    keeping the indices that do not refer to any answer. Grading is order
+    sensitive, so answers in canonical form come out sorted and any others
+    in decreasing order, which can never be totally correct either
+    """
+    if len(answers) == 1:
+        aidx = answers[0]
+        return [order[aidx]] if 0 <= aidx < num_of_answers else [aidx]
+    mapped = [
+        order[aidx] if 0 <= aidx < num_of_answers else aidx
+        for aidx in answers
+    ]
+    mapped.sort(
+        reverse=bool(answers_to_mask(num_of_answers, answers) & NOT_CANONICAL),
+    )
+    return mapped
+
+
+def _questions_at(questions, indices):
+    """
+    Generate the questions at the given indices. Question banks fetch them
+    by id, since their paging relies on questions being read in order
+    """
+    iter_at = getattr(questions, "iter_at", None)
+    if iter_at is not None:
+        return iter_at(indices)
+    return (questions[qidx] for qidx in indices)
+
+
+class Variant:
+    """
+    Shuffled version of a quiz, where both the order of the questions and of
+    their answers derive from a seed. Only the permutations are stored, as
+    indices into the precomputed tables, never a copy of the questions
+    """
+    def __init__(self, quiz, seed):
+        self._quiz = quiz
+        self._seed = seed
+        self._question_order = None
+        self._positions = None
+        self._answer_orders = None
+        self._correct_masks = None
+
+    @property
+    def seed(self):
+        """
+        Seed the variant derives from
+        """
+        return self._seed
+
+    def _ensure_orders(self):
+        """
+        Draw the permutations the first time they are needed
+        """
+        if self._question_order is not None:
+            return
+        rng = random.Random(self._seed)
+        questions = self._quiz.questions
+        order = list(range(len(questions)))
+        rng.shuffle(order)
+        self._question_order = array("L", order)
+
+        # Inverse of the order of the questions and ranks of the orders of
+        # the answers are indexed by canonical question, so that mapping back
+        # the answers walks the questions sequentially
+        self._positions = array("L", bytes(len(order) * array("L").itemsize))
+        for position, qidx in enumerate(order):
+            self._positions[qidx] = position
+        self._answer_orders = array("H", (
+            rng.randrange(len(_permutations(question.number_of_answers)[0]))
+            for question in questions
+        ))
+
+    def _shuffled(self, qidx, question):
+        """
+        Copy of a question with its answers in the order of the variant
+        """
+        perms, inverses = _permutations(question.number_of_answers)
+        rank = self._answer_orders[qidx]
+        return Question(
+            question.text,
+            [question.answers[canonical] for canonical in perms[rank]],
+            sorted(inverses[rank][canonical] for canonical in
+                   question.correct_answers),
+            question.label,
+        )
+
+    def question(self, position):
+        """
+        Question shown at the given position, with its answers shuffled
+        """
+        self._ensure_orders()
+        qidx = self._question_order[position]
+        return self._shuffled(
+            qidx, next(_questions_at(self._quiz.questions, [qidx])),
+        )
+
+    @property
+    def questions(self):
+        """
+        Generate the questions in the order of the variant
+        """
+        self._ensure_orders()
+        for qidx, question in zip(
+            self._question_order,
+            _questions_at(self._quiz.questions, self._question_order),
+        ):
+            yield self._shuffled(qidx, question)
+
+    def to_canonical(self, user_answers):
+        """
+        Map the answers given to the variant back to the order of the quiz
+        file, so that Quiz.compute_results grades them exactly as the
+        variant would
+        """
+        questions = self._quiz.questions
+        if len(user_answers) != len(questions):
+            raise ValueError("Wrong number of answers")
+
+        self._ensure_orders()
+        tables = _tables()
+        return [
+            _remap(
+                tables[question.number_of_answers][rank],
+                question.number_of_answers,
+                user_answers[position],
+            )
+            for question, position, rank in zip(
+                questions, self._positions, self._answer_orders,
+            )
+        ]
+
+    def from_canonical(self, user_answers):
+        """
+        Map answers given in the order of the quiz file to the variant
+        """
+        questions = self._quiz.questions
+        if len(user_answers) != len(questions):
+            raise ValueError("Wrong number of answers")
+
+        self._ensure_orders()
+        inverses = _tables(inverse=True)
+        shown_answers = [None] * len(questions)
+        for question, answers, position, rank in zip(
+            questions, user_answers, self._positions, self._answer_orders,
+        ):
+            num_of_answers = question.number_of_answers
+            shown_answers[position] = _remap(
+                inverses[num_of_answers][rank], num_of_answers, answers,
+            )
+        return shown_answers
+
+    def _ensure_correct_masks(self):
+        """
+        Compute the first time they are needed the masks of the correct
+        answers as shown by the variant, one byte per question
+        """
+        if self._correct_masks is not None:
+            return
+        self._ensure_orders()
+        inverses = _tables(inverse=True)
+        masks = array("B", bytes(len(self._positions)))
+        for qidx, (question, rank) in enumerate(
+            zip(self._quiz.questions, self._answer_orders),
+        ):
+            inverse = inverses[question.number_of_answers][rank]
+            for canonical in question.correct_answers:
+                masks[qidx] |= 1 << inverse[canonical]
+        self._correct_masks = masks
+
+    def compute_results(self, user_answers):
+        """
+        Grade the answers given to the variant as shown, against the correct
+        answers as shown, so nothing is mapped back while grading. The
+        summary refers to the questions in the order of the quiz file
+        """
+        questions = self._quiz.questions
+        if len(user_answers) != len(questions):
+            raise ValueError("Wrong number of answers")
+
+        self._ensure_correct_masks()
+        results = []
+        per_label = {}
+        masks = [{} for _ in range(MAX_ANSWERS + 1)]
+        for question, position, correct_mask in zip(
+            questions, self._positions, self._correct_masks,
+        ):
+            num_of_answers = question.number_of_answers
+            answers = user_answers[position]
+            # Few distinct lists of answers are ever given, so their masks
+            # are looked up rather than computed every time
+            key = tuple(answers)
+            mask = masks[num_of_answers].get(key)
+            if mask is None:
+                mask = masks[num_of_answers][key] = answers_to_mask(
+                    num_of_answers, answers,
+                )
+            only_c = _POPCOUNT[correct_mask]
+            if mask == correct_mask:
+                outcome = 1
+                correct, only_correct = num_of_answers, only_c
+            else:
+                selected = mask & ~NOT_CANONICAL
+                only_correct = _POPCOUNT[selected & correct_mask]
+                outcome = 0 if only_correct else -1
+                correct = (
+                    only_correct + num_of_answers -
+                    _POPCOUNT[selected | correct_mask]
+                )
+            results.append(outcome)
+
+            counters = per_label.get(question.label)
+            if counters is None:
+                counters = per_label[question.label] = _new_counters()
+            counters[_CORRECT] += correct
+            counters[_TOTAL] += num_of_answers
+            counters[_ONLY_CORRECT] += only_correct
+            counters[_ONLY_CORRECT_TOTAL] += only_c
+            counters[_OUTCOMES + outcome] += 1
+
+        totals = [
+            sum(slot) for slot in zip(*per_label.values())
+        ] or _new_counters()
+        summary = {HeaderText.RESULTS: results}
+        summary.update(_summarize(totals))
+        summary[HeaderText.LABELS] = {
+            label: _summarize(counters)
+            for label, counters in per_label.items()
+        }
+        return summary
+
+    def rows(self):
+        """
+        Generate the lines of the quiz file of the variant
+        """
+        self._ensure_orders()
+        tables = _tables()
+        for qidx, question in zip(
+            self._question_order,
+            _questions_at(self._quiz.questions, self._question_order),
+        ):
+            rank = self._answer_orders[qidx]
+            shown = list(question.answers)
+            for canonical in question.correct_answers:
+                shown[canonical] = f"@{shown[canonical]}"
+            yield [
+                question.label,
+                question.text,
+                ":".join([
+                    shown[canonical] for canonical in
+                    tables[len(shown)][rank]
+                ]),
+            ]
+
+    def export(self, filename):
+        """
+        Write the variant as a quiz file, one question at a time
+        """
+        with open(filename, "w", encoding="utf8", newline="") as out:
+            write_rows(out, self.rows())
+
+
+def export_variants(quiz, seeds, directory):
+    """
+    Write a quiz file for each seed into a directory, returning their paths
+    """
+    os.makedirs(directory, exist_ok=True)
+    filenames = []
+    for seed in seeds:
+        filename = os.path.join(directory, f"variant_{seed}.qz")
+        Variant(quiz, seed).export(filename)
+        filenames.append(filename)
+    return filenames
@@ -0,0 +1,256 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import gc
+import os
+import tracemalloc
+from collections import Counter
+
+# Allocations of the import machinery and of tracemalloc itself are noise,
+# left out of the lines reported
+_NOISE = (
+    tracemalloc.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+
+
+def count_widgets(widget):
+    """
+    Count a widget and all its descendants, by Tk class
+    """
+    counts = Counter()
+    stack = [widget]
+    while stack:
+        widget = stack.pop()
+        counts[widget.winfo_class()] += 1
+        stack.extend(widget.winfo_children())
+    return counts
+
+
+def count_variables(root):
+    """
+    Number of Tk variables alive, e.g. the BooleanVar of every answer
+    """
+    return sum(
+        1 for name in root.tk.splitlist(root.tk.call("info", "globals"))
+        if name.startswith("PY_VAR")
+    )
+
+
+def resident_memory():
+    """
+    Resident memory of the process in bytes, None where it is unknown
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _format_bytes(size):
+    """
+    Human readable size in megabytes
+    """
+    if size is None:
+        return "n/a"
+    return f"{size / (1 << 20):,.1f} MB"
+
+
+class MemoryProbe:
+    """
+    Snapshots of the memory allocated by Python, each one reported as the
+    difference from the previous stage
+    """
+    def __init__(self, top=5):
+        self._top = top
+        self._snapshot = None
+
+    def start(self):
+        """
+        Start tracing and take the first snapshot
+        """
+        tracemalloc.start()
+        gc.collect()
+        self._snapshot = tracemalloc.take_snapshot()
+
+    def stop(self):
+        """
+        Stop tracing, dropping the snapshots
+        """
+        self._snapshot = None
+        tracemalloc.stop()
+
+    def stage(self, name):
+        """
+        Report the memory allocated since the previous stage and the lines
+        allocating most of it, returning the difference in bytes
+        """
+        gc.collect()
+        # Filtering the traces of a big quiz would take far longer than
+        # comparing them, so only the statistics reported are filtered
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self._snapshot, "lineno")
+        self._snapshot = snapshot
+        delta = sum(stat.size_diff for stat in stats)
+        print(
+            f"[{name}] {delta:+,} bytes traced, "
+            f"{_format_bytes(tracemalloc.get_traced_memory()[0])} in total, "
+            f"{_format_bytes(resident_memory())} resident",
+        )
+        reported = [
+            stat for stat in stats
+            if stat.size_diff and stat.traceback[0].filename not in _NOISE
+        ]
+        for stat in reported[:self._top]:
+            print(f"    {stat}")
+        return delta
+
+
+def _report_widgets(window):
+    """
+    Print the widgets and Tk variables alive in the window
+    """
+    window.update_idletasks()
+    counts = count_widgets(window)
+    classes = ", ".join(
+        f"{name} {count}" for name, count in counts.most_common(5)
+    )
+    print(
+        f"    {sum(counts.values())} widgets ({classes}), "
+        f"{count_variables(window)} Tk variables",
+    )
+
+
+def _open_window(quiz_loader):
+    """
+    Build the main window hidden, or None when there is no display
+    """
+    try:
+        import tkinter as tk
+        from lib.components.main_window import MainWindow
+    except ImportError as exc:
+        print(f"UI not available, skipping its measures: {exc}")
+        return None
+    try:
+        window = MainWindow(800, 600, quiz_loader)
+    except tk.TclError as exc:
+        print(f"No display available, skipping the UI measures: {exc}")
+        return None
+    window.withdraw()
+    return window
+
+
+def _check_restarts(window, quiz, user_answers, cycles, tolerance):
+    """
+    Go through whole sessions and look for memory or widgets that are not
+    given back by restart(), returning a description of the leaks
+    """
+    gc.collect()
+    baseline = (
+        tracemalloc.get_traced_memory()[0],
+        sum(count_widgets(window).values()),
+        count_variables(window),
+    )
+    sample = baseline
+    for cycle in range(cycles):
+        window.set_quiz(quiz)
+        window.terminate_quiz(user_answers)
+        window.show_correction()
+        window.restart()
+        window.update_idletasks()
+        gc.collect()
+        sample = (
+            tracemalloc.get_traced_memory()[0],
+            sum(count_widgets(window).values()),
+            count_variables(window),
+        )
+        print(
+            f"    cycle {cycle + 1}: {sample[0] - baseline[0]:+,} bytes, "
+            f"{sample[1] - baseline[1]:+} widgets, "
+            f"{sample[2] - baseline[2]:+} Tk variables",
+        )
+
+    leaks = []
+    if sample[1] > baseline[1]:
+        leaks.append(f"{sample[1] - baseline[1]} widgets")
+    if sample[2] > baseline[2]:
+        leaks.append(f"{sample[2] - baseline[2]} Tk variables")
+    growth = (sample[0] - baseline[0]) / max(cycles, 1)
+    if growth > tolerance:
+        leaks.append(f"{growth:,.0f} bytes per cycle")
+    return leaks
+
+
+def run_diagnostics(filename, quiz_loader, cycles=5, tolerance=4096,
+                    top=5):
+    """
+    Measure the memory used by a quiz and by a session taken on it, stage
+    by stage, and whether restarting the session gives it back. Only Python
+    allocations are traced: Tk widgets live in Tcl memory, so they are
+    counted instead. Return the leaks found across the restart cycles
+    """
+    probe = MemoryProbe(top)
+    probe.start()
+    window = None
+    try:
+        quiz = quiz_loader(filename)
+        loaded = probe.stage("load")
+        num_of_questions = len(quiz.questions)
+        print(
+            f"    {num_of_questions:,} questions, about "
+            f"{loaded / num_of_questions:,.0f} bytes per question",
+        )
+
+        window = _open_window(quiz_loader)
+        if window is None:
+            return []
+        probe.stage("window")
+        _report_widgets(window)
+
+        window.set_quiz(quiz)
+        probe.stage("quiz start")
+        _report_widgets(window)
+        # Every question is answered with its first option, so that the
+        # review has both right and wrong answers to show
+        user_answers = [[0] for _ in range(num_of_questions)]
+        window.terminate_quiz(user_answers)
+        probe.stage("submit")
+        _report_widgets(window)
+        window.show_correction()
+        probe.stage("review")
+        _report_widgets(window)
+        window.restart()
+        probe.stage("restart")
+        _report_widgets(window)
+
+        print(f"[restart cycles] {cycles} sessions")
+        leaks = _check_restarts(
+            window, quiz, user_answers, cycles, tolerance,
+        )
+        if leaks:
+            print(f"    leaking: {', '.join(leaks)}")
+        else:
+            print("    no leak found")
+        return leaks
+    finally:
+        if window is not None:
+            window.destroy()
+        probe.stop()
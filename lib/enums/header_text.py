@@ -30,3 +30,5 @@ class HeaderText(enum.Enum):
     PARTIALLY_CORRECT = "partially correct"
     TOTALLY_WRONG = "totally wrong"
     TOTALLY_CORRECT_RATIO = "totally correct %"
+    LABELS = "labels"
+    ABILITY = "estimated ability"
@@ -0,0 +1,95 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+
+from lib.datatypes.quiz import question_to_row, write_rows
+from lib.datatypes.sqlite_quiz import SqliteQuiz, import_quiz
+from lib.datatypes.variant import Variant
+
+# Grading engines by name. An engine is a function taking a quiz and
+# returning a function that grades a submission of that quiz, producing the
+# same summary as Quiz.compute_results
+ENGINES = {}
+
+REFERENCE = "reference"
+
+
+def register_engine(name):
+    """
+    Decorator registering a grading engine under the given name
+    """
+    def register(engine):
+        ENGINES[name] = engine
+        return engine
+    return register
+
+
+@register_engine(REFERENCE)
+def reference_engine(quiz):
+    """
+    In-memory grading of Quiz.compute_results
+    """
+    return quiz.compute_results
+
+
+class _SqliteGrader:
+    """
+    Grader backed by a temporary database, removed along with the grader
+    """
+    def __init__(self, quiz):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        qz_filename = os.path.join(self._tmp_dir.name, "quiz.qz")
+        db_filename = os.path.join(self._tmp_dir.name, "quiz.db")
+        with open(qz_filename, "w", encoding="utf8", newline="") as qz_file:
+            write_rows(qz_file, (question_to_row(q) for q in quiz.questions))
+        import_quiz(qz_filename, db_filename)
+        self._quiz = SqliteQuiz(db_filename)
+
+    def __call__(self, user_answers):
+        return self._quiz.compute_results(user_answers)
+
+
+@register_engine("sqlite")
+def sqlite_engine(quiz):
+    """
+    Grading pushed down into SQLite by SqliteQuiz.compute_results
+    """
+    return _SqliteGrader(quiz)
+
+
+class _VariantGrader:
+    """
+    Grader going through a shuffled variant of the quiz: submissions are
+    mapped to the variant and graded back by Variant.compute_results
+    """
+    def __init__(self, quiz, seed=0):
+        self._variant = Variant(quiz, seed)
+
+    def __call__(self, user_answers):
+        return self._variant.compute_results(
+            self._variant.from_canonical(user_answers),
+        )
+
+
+@register_engine("variant")
+def variant_engine(quiz):
+    """
+    Grading of the answers given to a variant of the quiz
+    """
+    return _VariantGrader(quiz)
@@ -0,0 +1,255 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Differential conformance and performance-regression harness for grading
+engines: random quizzes and submissions are graded by every engine and
+compared with Quiz.compute_results, and the throughput of each engine,
+relative to the reference engine, is checked against its stored baseline
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+from lib.datatypes.question import Question
+from lib.datatypes.quiz import MAX_ANSWERS, Quiz
+from lib.enums.header_text import HeaderText
+from lib.grading.engines import ENGINES, REFERENCE
+
+# Throughput baselines committed along with the harness
+BASELINES = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "grading_baselines.json",
+)
+
+# Engines checked against the reference one
+_ENGINES = sorted(name for name in ENGINES if name != REFERENCE)
+
+
+def random_quiz(rng, num_of_questions, num_of_labels=5):
+    """
+    Generate a quiz with random answers and correct answers
+    """
+    questions = []
+    for qidx in range(num_of_questions):
+        num_of_answers = rng.randint(1, MAX_ANSWERS)
+        questions.append(
+            Question(
+                f"Question {qidx}",
+                [f"Answer {aidx}" for aidx in range(num_of_answers)],
+                sorted(rng.sample(
+                    range(num_of_answers), rng.randint(1, num_of_answers),
+                )),
+                f"label{rng.randrange(num_of_labels)}",
+            ),
+        )
+    return Quiz.from_questions(questions)
+
+
+def random_answers(rng, question):
+    """
+    Generate the answers to a question, stressing the corner cases of the
+    grading: exact and reordered correct answers, duplicates, indices out of
+    range, no answer at all and random selections
+    """
+    num_of_answers = question.number_of_answers
+    correct_answers = question.correct_answers
+    kind = rng.randrange(7)
+    if kind == 0:
+        return list(correct_answers)
+    if kind == 1:
+        return list(reversed(correct_answers))
+    if kind == 2:
+        return sorted(correct_answers + [rng.choice(correct_answers)])
+    if kind == 3:
+        return sorted(rng.sample(range(num_of_answers),
+                                 rng.randint(0, num_of_answers))) + \
+            [rng.choice([-1, num_of_answers, MAX_ANSWERS, 9])]
+    if kind == 4:
+        return []
+    answers = rng.sample(range(num_of_answers),
+                         rng.randint(0, num_of_answers))
+    if kind == 5:
+        answers.sort()
+    return answers
+
+
+def random_submission(rng, quiz):
+    """
+    Generate the answers to every question of a quiz
+    """
+    return [random_answers(rng, question) for question in quiz.questions]
+
+
+def _first_difference(expected, actual):
+    """
+    Describe the first difference between two summaries
+    """
+    for head in HeaderText:
+        if expected.get(head) != actual.get(head):
+            if head == HeaderText.RESULTS:
+                qidx = next(
+                    (qidx for qidx, (exp, act) in enumerate(
+                        zip(expected[head], actual.get(head, [])),
+                    ) if exp != act),
+                    None,
+                )
+                return f"{head.value} differ at question {qidx}"
+            if head == HeaderText.LABELS:
+                return f"{head.value} differ"
+            return f"{head.value}: expected {expected.get(head)}, " \
+                   f"got {actual.get(head)}"
+    return "summaries differ"
+
+
+def check_conformance(engines, rounds=50, max_questions=200, seed=0):
+    """
+    Grade random submissions with every engine and return the differences
+    from the reference engine
+    """
+    rng = random.Random(seed)
+    failures = []
+    for round_idx in range(rounds):
+        quiz = random_quiz(rng, rng.randint(1, max_questions))
+        graders = {name: ENGINES[name](quiz) for name in engines}
+        reference = ENGINES[REFERENCE](quiz)
+        for _ in range(5):
+            user_answers = random_submission(rng, quiz)
+            expected = reference(user_answers)
+            for name, grade in graders.items():
+                actual = grade(user_answers)
+                if actual != expected:
+                    failures.append(
+                        f"{name} (round {round_idx}): "
+                        f"{_first_difference(expected, actual)}",
+                    )
+    return failures
+
+
+def measure_throughput(engines, num_of_questions=20000, repeat=5, seed=0):
+    """
+    Questions graded per second by each engine, best of a few runs. The runs
+    of the engines are interleaved, so that they all share the same load
+    """
+    rng = random.Random(seed)
+    quiz = random_quiz(rng, num_of_questions)
+    user_answers = random_submission(rng, quiz)
+    graders = {name: ENGINES[name](quiz) for name in engines}
+    best = dict.fromkeys(engines, float("inf"))
+    for _ in range(repeat):
+        for name, grade in graders.items():
+            start = time.perf_counter()
+            grade(user_answers)
+            best[name] = min(best[name], time.perf_counter() - start)
+    return {name: num_of_questions / best[name] for name in engines}
+
+
+def check_throughput(engines, baselines, tolerance):
+    """
+    Measure the throughput of the engines relative to the reference engine
+    and return the ones slower than their baseline or without one, along
+    with the ratios
+    """
+    failures = []
+    ratios = {}
+    for name in engines:
+        throughput = measure_throughput([REFERENCE, name])
+        ratios[name] = round(throughput[name] / throughput[REFERENCE], 3)
+        baseline = baselines.get(name)
+        if baseline is None:
+            status = "no baseline"
+            failures.append(
+                f"{name}: no baseline, store one with --update-baselines",
+            )
+        else:
+            status = f"baseline {baseline:.3f}"
+            if ratios[name] < baseline * (1 - tolerance):
+                failures.append(
+                    f"{name}: {ratios[name]:.3f} times the reference is "
+                    f"slower than the baseline of {baseline:.3f}",
+                )
+        print(f"  {name}: {throughput[name]:,.0f} questions/s, "
+              f"{ratios[name]:.3f} times the reference ({status})")
+    return failures, ratios
+
+
+def main():
+    """
+    Run the harness, exiting with an error if any check fails
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--engine",
+        action="append",
+        choices=_ENGINES,
+        help="engine to check against the reference (default: all of them)",
+    )
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--baselines",
+        default=BASELINES,
+        help="file storing the throughput baselines (default: the one "
+             "next to the harness)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="slowdown allowed before failing (default: 0.2)",
+    )
+    parser.add_argument(
+        "--update-baselines",
+        action="store_true",
+        help="store the measured throughputs as the new baselines",
+    )
+    args = parser.parse_args()
+    engines = args.engine or _ENGINES
+
+    print("Conformance:")
+    failures = check_conformance(engines, args.rounds, seed=args.seed)
+    for failure in failures:
+        print(f"  {failure}")
+    if not failures:
+        print("  all engines match the reference")
+
+    try:
+        with open(args.baselines, "r", encoding="utf8") as baselines_file:
+            baselines = json.load(baselines_file)
+    except FileNotFoundError:
+        baselines = {}
+
+    print("Throughput:")
+    slow, ratios = check_throughput(engines, baselines, args.tolerance)
+    if args.update_baselines:
+        baselines.update(ratios)
+        with open(args.baselines, "w", encoding="utf8") as baselines_file:
+            json.dump(baselines, baselines_file, indent=2, sort_keys=True)
+            baselines_file.write("\n")
+    else:
+        failures += slow
+        for failure in slow:
+            print(f"  {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import curses
+import textwrap
+
+from lib.enums.header_text import HeaderText
+
+_HELP = {
+    "quiz": "←/→ question  ↑/↓ answer  SPACE select  s submit  q quit",
+    "summary": "r review  m review mistakes  q quit",
+    "review": "←/→ question  q back to the summary",
+}
+
+
+class CursesUI:
+    """
+    Terminal front end for the quiz flow, built on curses
+    """
+    def __init__(self, quiz):
+        self._quiz = quiz
+        self._num_of_questions = len(quiz.questions)
+        self._mode = "quiz"
+        self._curr_idx = 0
+        self._cursor = 0
+
+        # Only the questions actually answered are stored
+        self._selections = {}
+        self._user_answers = None
+        self._summary = None
+        self._visible = None
+
+        # Attributes of the answers in the review, chosen once the terminal
+        # is known
+        self._right_attr = None
+        self._wrong_attr = None
+
+    def start(self):
+        """
+        Run the interface until the user quits
+        """
+        curses.wrapper(self._main_loop)
+
+    def _main_loop(self, screen):
+        """
+        Draw the current screen and dispatch key presses
+        """
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass  # not every terminal can hide the cursor
+        self._init_attrs()
+
+        handlers = {
+            "quiz": self._handle_quiz_key,
+            "summary": self._handle_summary_key,
+            "review": self._handle_review_key,
+        }
+        while True:
+            screen.erase()
+            if self._mode == "summary":
+                self._draw_summary(screen)
+            else:
+                self._draw_question(screen)
+            self._draw_line(screen, screen.getmaxyx()[0] - 1,
+                            _HELP[self._mode], curses.A_REVERSE)
+            screen.refresh()
+
+            key = screen.getch()
+            if key == curses.KEY_RESIZE:
+                # The next iteration redraws everything at the new size
+                curses.update_lines_cols()
+                continue
+            if not handlers[self._mode](screen, key):
+                return
+
+    def _init_attrs(self):
+        """
+        Show right and wrong answers in green and red, or in bold and
+        underlined on terminals without colors
+        """
+        self._right_attr, self._wrong_attr = curses.A_BOLD, curses.A_UNDERLINE
+        if not curses.has_colors():
+            return
+        background = -1
+        try:
+            curses.use_default_colors()
+        except curses.error:
+            background = curses.COLOR_BLACK
+        curses.init_pair(1, curses.COLOR_GREEN, background)
+        curses.init_pair(2, curses.COLOR_RED, background)
+        self._right_attr = curses.color_pair(1)
+        self._wrong_attr = curses.color_pair(2)
+
+    def _draw_line(self, screen, row, text, attr=curses.A_NORMAL):
+        """
+        Draw a line of text, clipped to the size of the screen
+        """
+        lines, cols = screen.getmaxyx()
+        if 0 <= row < lines and cols > 1:
+            try:
+                screen.addnstr(row, 0, text, cols - 1, attr)
+            except curses.error:
+                pass  # the screen shrank while drawing
+
+    def _wrap(self, screen, text, **kwargs):
+        """
+        Wrap the text to the width of the screen
+        """
+        return textwrap.wrap(text, max(screen.getmaxyx()[1] - 1, 1), **kwargs)
+
+    def _draw_question(self, screen):
+        """
+        Draw the current question, and its correction in review mode
+        """
+        reviewing = self._mode == "review"
+        if reviewing:
+            qidx = self._visible[self._curr_idx]
+            position = f"{self._curr_idx + 1}/{len(self._visible)} " \
+                       f"(question {qidx + 1})"
+            chosen = self._user_answers[qidx]
+        else:
+            qidx = self._curr_idx
+            position = f"{qidx + 1}/{self._num_of_questions}"
+            chosen = self._selections.get(qidx, ())
+        question = self._quiz.questions[qidx]
+
+        self._draw_line(screen, 0, f"{position}  [{question.label}]",
+                        curses.A_BOLD)
+        row = 2
+        for line in self._wrap(screen, question.text):
+            self._draw_line(screen, row, line, curses.A_BOLD)
+            row += 1
+        row += 1
+
+        for idx, ans in enumerate(question.answers):
+            attr = curses.A_NORMAL
+            if reviewing:
+                if idx in question.correct_answers and idx in chosen:
+                    attr = self._right_attr
+                elif idx in question.correct_answers or idx in chosen:
+                    attr = self._wrong_attr
+            elif idx == self._cursor:
+                attr = curses.A_REVERSE
+            mark = "x" if idx in chosen else " "
+            for line in self._wrap(
+                screen, f"[{mark}] {ans}", subsequent_indent=" " * 4,
+            ):
+                self._draw_line(screen, row, line, attr)
+                row += 1
+
+    def _draw_summary(self, screen):
+        """
+        Draw the summary of the results
+        """
+        self._draw_line(screen, 0, "Summary", curses.A_BOLD)
+        row = 2
+        for head, value in self._summary.items():
+            if head in (HeaderText.RESULTS, HeaderText.LABELS):
+                continue
+            self._draw_line(
+                screen, row, f"{head.value.title():<24}{_format(head, value)}",
+            )
+            row += 1
+
+        row += 1
+        heads = (
+            HeaderText.RATIO,
+            HeaderText.TOTALLY_CORRECT,
+            HeaderText.PARTIALLY_CORRECT,
+            HeaderText.TOTALLY_WRONG,
+        )
+        self._draw_line(
+            screen,
+            row,
+            f"{'Label':<20}" +
+            "".join(f"{head.value.title():>18}" for head in heads),
+            curses.A_BOLD,
+        )
+        for label, metrics in self._summary[HeaderText.LABELS].items():
+            row += 1
+            self._draw_line(
+                screen,
+                row,
+                f"{label or '-':<20}" + "".join(
+                    f"{_format(head, metrics[head]):>18}" for head in heads
+                ),
+            )
+
+    def _handle_quiz_key(self, screen, key):
+        """
+        Navigate the questions and select the answers
+        """
+        question = self._quiz.questions[self._curr_idx]
+        if key in (curses.KEY_LEFT, ord("p")):
+            self._move(-1, self._num_of_questions)
+        elif key in (curses.KEY_RIGHT, ord("n")):
+            self._move(1, self._num_of_questions)
+        elif key == curses.KEY_UP:
+            self._cursor = max(self._cursor - 1, 0)
+        elif key == curses.KEY_DOWN:
+            self._cursor = min(self._cursor + 1, len(question.answers) - 1)
+        elif key == ord(" "):
+            chosen = self._selections.setdefault(self._curr_idx, [])
+            if self._cursor in chosen:
+                chosen.remove(self._cursor)
+            else:
+                chosen.append(self._cursor)
+                chosen.sort()
+            if not chosen:
+                del self._selections[self._curr_idx]
+        elif key == ord("s"):
+            if self._confirm(screen, "Submit your answers and terminate "
+                                     "the quiz? [y/n]"):
+                self._submit()
+        elif key == ord("q"):
+            return not self._confirm(screen, "Do you want to quit? [y/n]")
+        return True
+
+    def _handle_summary_key(self, _screen, key):
+        """
+        Open the correction or quit
+        """
+        if key == ord("r"):
+            self._review(range(self._num_of_questions))
+        elif key == ord("m"):
+            self._review([
+                qidx for qidx, result in
+                enumerate(self._summary[HeaderText.RESULTS]) if result < 1
+            ])
+        elif key == ord("q"):
+            return False
+        return True
+
+    def _handle_review_key(self, _screen, key):
+        """
+        Navigate the correction
+        """
+        if key in (curses.KEY_LEFT, ord("p")):
+            self._move(-1, len(self._visible))
+        elif key in (curses.KEY_RIGHT, ord("n")):
+            self._move(1, len(self._visible))
+        elif key == ord("q"):
+            self._mode = "summary"
+        return True
+
+    def _move(self, inc, num_of_questions):
+        """
+        Move to another question, without going past the first or the last
+        """
+        self._curr_idx = min(max(self._curr_idx + inc, 0),
+                             num_of_questions - 1)
+        self._cursor = 0
+
+    def _confirm(self, screen, message):
+        """
+        Ask the user a yes/no question on the last line, a resize cancels it
+        """
+        last = screen.getmaxyx()[0] - 1
+        screen.move(last, 0)
+        screen.clrtoeol()
+        self._draw_line(screen, last, message, curses.A_REVERSE)
+        screen.refresh()
+        key = screen.getch()
+        if key == curses.KEY_RESIZE:
+            curses.update_lines_cols()
+        return key in (ord("y"), ord("Y"))
+
+    def _submit(self):
+        """
+        Grade the answers and show the summary
+        """
+        self._user_answers = [
+            self._selections.get(qidx, [])
+            for qidx in range(self._num_of_questions)
+        ]
+        self._summary = self._quiz.compute_results(self._user_answers)
+        self._selections = {}
+        self._mode = "summary"
+
+    def _review(self, visible):
+        """
+        Show the correction of the given questions
+        """
+        if not visible:
+            return
+        self._visible = visible
+        self._curr_idx = 0
+        self._mode = "review"
+
+
+def _format(head, value):
+    """
+    Format a value of the summary
+    """
+    if head.name.endswith("RATIO"):
+        return f"{value:.2%}"
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return f"{value}"
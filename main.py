@@ -24,14 +24,238 @@ Program to test knowledge with multiple choice quizzes
 __version__ = '1.0'
 __author__ = 'A-725-K (Andrea Canepa)'
 
-from lib.components.main_window import MainWindow
+import argparse
+import os
+import sys
+
+
+def parse_args():
+    """
+    Parse command line arguments
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tui",
+        metavar="QUIZ_FILE",
+        help="run the quiz in the terminal instead of opening a window",
+    )
+    parser.add_argument(
+        "--import-db",
+        nargs=2,
+        metavar=("QUIZ_FILE", "DB_FILE"),
+        help="import a quiz file into a new SQLite question bank and exit",
+    )
+    parser.add_argument(
+        "--convert",
+        nargs=2,
+        metavar=("SOURCE", "TARGET"),
+        help="convert between .qz, .jsonl and .csv (only from .qz) files, "
+             "by their extension, and exit",
+    )
+    parser.add_argument(
+        "--export-variants",
+        nargs=2,
+        metavar=("QUIZ_FILE", "DIRECTORY"),
+        help="write shuffled variants of a quiz, one per seed, into a "
+             "directory and exit",
+    )
+    parser.add_argument(
+        "--seeds",
+        nargs="+",
+        type=int,
+        default=[1, 2, 3, 4],
+        metavar="SEED",
+        help="seeds of the variants written by --export-variants "
+             "(default: 1 2 3 4)",
+    )
+    parser.add_argument(
+        "--export-html",
+        nargs=2,
+        metavar=("QUIZ_FILE", "TARGET"),
+        help="export a quiz as a printable HTML page and exit",
+    )
+    parser.add_argument(
+        "--answer-key",
+        action="store_true",
+        help="tick the correct answers in the exported page",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        metavar="N",
+        help="split the export into pages of N questions, rendered in "
+             "parallel, inside the TARGET directory",
+    )
+    parser.add_argument(
+        "--diagnostics",
+        metavar="QUIZ_FILE",
+        help="report the memory and widgets used by a session on a quiz, "
+             "and whether restarting leaks them, then exit",
+    )
+    parser.add_argument(
+        "--cycles",
+        type=int,
+        default=5,
+        help="restart cycles run by --diagnostics (default: 5)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="run the daemon keeping recently used quizzes ready to be served",
+    )
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="load the quizzes through the daemon",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="socket of the daemon (default: per-user socket)",
+    )
+    parser.add_argument(
+        "--cache-mb",
+        type=int,
+        default=512,
+        help="memory budget of the daemon in MB (default: 512)",
+    )
+    return parser.parse_args()
 
 
 def main():
     """
     Entry point
     """
-    MainWindow(800, 600).start()
+    args = parse_args()
+
+    if args.import_db:
+        from lib.datatypes.sqlite_quiz import import_quiz
+        from lib.exceptions.parse_exception import ParseException
+
+        try:
+            import_quiz(*args.import_db)
+        except (OSError, UnicodeDecodeError, ParseException) as exc:
+            print(f"Cannot import the quiz: {exc}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.convert:
+        from lib.converters.converters import convert
+        from lib.exceptions.parse_exception import ParseException
+
+        try:
+            convert(*args.convert)
+        except (OSError, UnicodeDecodeError, ParseException) as exc:
+            print(f"Cannot convert the quiz: {exc}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.export_variants:
+        from lib.datatypes.loader import load_quiz
+        from lib.datatypes.variant import export_variants
+        from lib.exceptions.parse_exception import ParseException
+
+        source, directory = args.export_variants
+        try:
+            for filename in export_variants(
+                load_quiz(source), args.seeds, directory,
+            ):
+                print(filename)
+        except (OSError, UnicodeDecodeError, ParseException) as exc:
+            print(f"Cannot export the variants: {exc}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.export_html:
+        from lib.converters.html_exporter import (
+            export_html,
+            export_html_chunks,
+        )
+        from lib.datatypes.quiz import iter_questions
+        from lib.datatypes.sqlite_quiz import SQLITE_EXTENSIONS, SqliteQuiz
+        from lib.exceptions.parse_exception import ParseException
+
+        source, target = args.export_html
+        title = os.path.basename(source)
+        try:
+            # Questions are streamed, or paged in from a question bank
+            if source.endswith(SQLITE_EXTENSIONS):
+                questions = SqliteQuiz(source).questions
+            else:
+                questions = iter_questions(source)
+            if args.chunk_size is not None:
+                export_html_chunks(
+                    questions,
+                    target,
+                    args.chunk_size,
+                    answer_key=args.answer_key,
+                    title=title,
+                )
+            else:
+                export_html(
+                    questions, target, answer_key=args.answer_key,
+                    title=title,
+                )
+        except (OSError, UnicodeDecodeError, ParseException,
+                ValueError) as exc:
+            print(f"Cannot export the quiz: {exc}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.daemon or args.client:
+        from lib.daemon.server import default_socket_path
+
+        socket_path = args.socket or default_socket_path()
+
+    if args.daemon:
+        from lib.daemon.server import run_daemon
+
+        try:
+            run_daemon(socket_path, args.cache_mb << 20)
+        except OSError as exc:
+            print(f"Cannot start the daemon: {exc}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.client:
+        from lib.daemon.client import make_client_loader
+
+        quiz_loader = make_client_loader(socket_path)
+    else:
+        from lib.datatypes.loader import load_quiz
+
+        quiz_loader = load_quiz
+
+    if args.diagnostics:
+        from lib.diagnostics.memory import run_diagnostics
+        from lib.exceptions.parse_exception import ParseException
+
+        try:
+            leaks = run_diagnostics(args.diagnostics, quiz_loader, args.cycles)
+        except (OSError, UnicodeDecodeError, ParseException) as exc:
+            print(f"File not supported or malformed: {exc}", file=sys.stderr)
+            sys.exit(1)
+        if leaks:
+            sys.exit(1)
+        return
+
+    # The front ends are imported lazily, so that the terminal one does not
+    # pay for loading Tk and PIL
+    if args.tui:
+        from lib.exceptions.parse_exception import ParseException
+        from lib.tui.curses_ui import CursesUI
+
+        try:
+            quiz = quiz_loader(args.tui)
+        except (OSError, UnicodeDecodeError, ParseException) as exc:
+            print(f"File not supported or malformed: {exc}", file=sys.stderr)
+            sys.exit(1)
+        CursesUI(quiz).start()
+        return
+
+    from lib.components.main_window import MainWindow
+
+    MainWindow(800, 600, quiz_loader).start()
 
 
 if __name__ == "__main__":
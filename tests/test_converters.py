@@ -0,0 +1,152 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from lib.converters.converters import convert
+from lib.converters.csv_converter import HEADER
+from lib.datatypes.question import Question
+from lib.datatypes.quiz import (
+    Quiz, iter_questions, question_to_row, write_rows,
+)
+from lib.exceptions.parse_exception import ParseException
+
+# Questions exercising the quoting of the .qz format
+QUESTIONS = [
+    Question("Plain question?", ["yes", "no"], [0], "label1"),
+    Question("Commas, \"quotes\" and\nnewlines", ["a, b", "\"c\""], [1], ""),
+    Question("Carriage\r\nreturns", ["x\ry", "z"], [0, 1], "cr\rlabel"),
+    Question("Ünïcödé ✓", ["α", "β", "γ"], [2], "ελληνικά"),
+    Question(
+        "Seven answers",
+        [f"answer {aidx}" for aidx in range(7)],
+        [0, 3, 6],
+        "label2",
+    ),
+]
+
+
+def _fields(questions):
+    """
+    Comparable content of questions
+    """
+    return [
+        (q.label, q.text, q.answers, q.correct_answers) for q in questions
+    ]
+
+
+class ConvertersTest(unittest.TestCase):
+    """
+    Round trips between the supported formats
+    """
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self._qz = self._path("quiz.qz")
+        with open(self._qz, "w", encoding="utf8", newline="") as qz_file:
+            write_rows(qz_file, (question_to_row(q) for q in QUESTIONS))
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def _path(self, name):
+        return os.path.join(self._dir, name)
+
+    def _write_jsonl(self, records):
+        jsonl = self._path("bad.jsonl")
+        with open(jsonl, "w", encoding="utf8") as jsonl_file:
+            for record in records:
+                jsonl_file.write(json.dumps(record) + "\n")
+        return jsonl
+
+    def test_source_is_read_back_unchanged(self):
+        self.assertEqual(_fields(iter_questions(self._qz)), _fields(QUESTIONS))
+
+    def test_qz_jsonl_qz(self):
+        convert(self._qz, self._path("quiz.jsonl"))
+        convert(self._path("quiz.jsonl"), self._path("back.qz"))
+        self.assertEqual(
+            _fields(Quiz(self._path("back.qz")).questions),
+            _fields(QUESTIONS),
+        )
+
+    def test_compressed_round_trip(self):
+        convert(self._qz, self._path("quiz.jsonl.gz"))
+        convert(self._path("quiz.jsonl.gz"), self._path("quiz.qz.xz"))
+        convert(self._path("quiz.qz.xz"), self._path("quiz.jsonl.bz2"))
+        convert(self._path("quiz.jsonl.bz2"), self._path("back.qz"))
+        self.assertEqual(
+            _fields(iter_questions(self._path("quiz.qz.xz"))),
+            _fields(QUESTIONS),
+        )
+        self.assertEqual(
+            _fields(iter_questions(self._path("back.qz"))),
+            _fields(QUESTIONS),
+        )
+
+    def test_csv_export(self):
+        convert(self._qz, self._path("quiz.csv"))
+        with open(self._path("quiz.csv"), encoding="utf8",
+                  newline="") as csv_file:
+            rows = list(csv.reader(csv_file))
+        self.assertEqual(rows[0], HEADER)
+        self.assertEqual(len(rows), len(QUESTIONS) + 1)
+        for row, question in zip(rows[1:], QUESTIONS):
+            self.assertEqual(row[:2], [question.label, question.text])
+            self.assertEqual(
+                row[-1],
+                " ".join(str(aidx + 1) for aidx in question.correct_answers),
+            )
+
+    def test_rejected_questions(self):
+        valid = {"label": "l", "text": "t", "answers": ["a", "b"],
+                 "correct_answers": [0]}
+        for change in (
+            {"answers": ["a:b", "c"]},
+            {"label": "#comment"},
+            {"answers": [f"a{aidx}" for aidx in range(8)]},
+            {"answers": ["a", "@b"]},
+            {"correct_answers": [1, 0]},
+            {"correct_answers": [2]},
+            {"correct_answers": []},
+        ):
+            with self.subTest(change=change):
+                jsonl = self._write_jsonl([valid, {**valid, **change}])
+                with self.assertRaisesRegex(ParseException, "line 2"):
+                    convert(jsonl, self._path("out.qz"))
+                self.assertFalse(os.path.exists(self._path("out.qz")))
+
+    def test_failure_keeps_existing_target(self):
+        target = self._path("quiz.jsonl")
+        convert(self._qz, target)
+        with open(target, encoding="utf8") as jsonl_file:
+            content = jsonl_file.read()
+        with self.assertRaises(OSError):
+            convert(self._path("missing.qz.gz"), target)
+        with open(target, encoding="utf8") as jsonl_file:
+            self.assertEqual(jsonl_file.read(), content)
+        self.assertEqual(
+            sorted(os.listdir(self._dir)), ["quiz.jsonl", "quiz.qz"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# quiz-helper: Test your knowledge and revise important topics.
+#
+# Copyright (C) 2023 A-725-K (Andrea Canepa)
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+from lib.enums.header_text import HeaderText
+from lib.grading.engines import ENGINES, REFERENCE
+from lib.grading.harness import check_conformance
+
+
+class ConformanceTest(unittest.TestCase):
+    """
+    Every grading engine against Quiz.compute_results
+    """
+    def test_engines_match_the_reference(self):
+        for name in sorted(ENGINES):
+            if name == REFERENCE:
+                continue
+            with self.subTest(engine=name):
+                self.assertEqual(
+                    check_conformance([name], rounds=10, max_questions=100),
+                    [],
+                )
+
+    def test_drift_is_reported(self):
+        def drifting_engine(quiz):
+            def grade(user_answers):
+                summary = quiz.compute_results(user_answers)
+                summary[HeaderText.RESULTS] = [
+                    max(result, 0) for result in summary[HeaderText.RESULTS]
+                ]
+                return summary
+            return grade
+
+        ENGINES["drifting"] = drifting_engine
+        try:
+            failures = check_conformance(["drifting"], rounds=2)
+        finally:
+            del ENGINES["drifting"]
+        self.assertTrue(failures)
+        self.assertIn("differ at question", failures[0])
+
+
+if __name__ == "__main__":
+    unittest.main()